@@ -1,22 +1,179 @@
+import asyncio
+import logging
+import threading
+import time
 import gradio as gr
+import numpy as np
 from chatbot import YouTubeChatbot
+from collections import OrderedDict
+from functools import cached_property
 from typing import List, Tuple
 import traceback
 from db_cleanup import DBCleanupManager
 from config import Config
 
+logger = logging.getLogger(__name__)
+
+# Process-wide singletons shared by every GradioApp instance, so multiple
+# entrypoints (CLI --ui, python app.py) never build a second embedding
+# client or ChromaDB connection.
+_SHARED = {"chatbot": None, "cleanup_manager": None}
+
+# UI strings and widget config built once at import time so launch() (and
+# hot-reload/test harnesses that call it repeatedly) never re-allocates them
+_CSS = """
+.gradio-container {
+    font-family: 'Arial', sans-serif;
+}
+.chat-message {
+    padding: 10px;
+    border-radius: 10px;
+}
+"""
+
+_HEADER_MD = """
+# 🤖 YouTube RAG Chatbot
+
+### Ask questions about YouTube videos using AI!
+
+**How to use:**
+1. Add YouTube video URLs in the "Add Videos" tab
+2. Go to "Chat" tab and ask questions
+3. Check "Statistics" for knowledge base info
+"""
+
+_TIPS_MD = """
+**Tips:**
+- Videos must have English transcripts available
+- Processing may take 30-60 seconds depending on video length
+- Paste several URLs (one per line) to add them in a single batch
+"""
+
+_EXAMPLES_MD = """
+**Example Questions:**
+- What is this video about?
+- Summarize the main points
+- What did they say about [topic]?
+- Compare the information from different videos
+"""
+
+_CLEANUP_INTRO_MD = """
+Manage old database runs to free up disk space. Each application run creates a new 
+timestamped database folder. Use this tab to view storage usage and clean up old runs.
+"""
+
+_CLEANUP_HELP_MD = """
+**How it works:**
+1. Click "Preview Cleanup" to see what will be deleted
+2. Review the list of runs to be deleted
+3. Click "Confirm Cleanup" to proceed with deletion
+
+**Retention Policy:**
+- The current run is always protected
+- Runs are kept based on configured retention settings
+- See CLEANUP.md for configuration details
+"""
+
+_CHATBOT_KWARGS = {
+    "label": "Conversation",
+    "height": 400,
+    "type": "tuples",  # Explicitly set to avoid warning
+}
+
+
+def _fmt_exc(e: Exception) -> str:
+    """
+    Format an exception for the UI without stringifying every frame
+
+    The traceback goes through the logging framework, which only walks
+    and renders the frames if a handler actually emits the record; the
+    UI gets just the exception type and message (plus a bounded
+    traceback when DEBUG is on), so error storms don't burn CPU
+    building multi-KB strings per request.
+    """
+    logger.exception("UI handler error: %s", e)
+    if Config.DEBUG:
+        return f"{type(e).__name__}: {e}\n\n{traceback.format_exc(limit=5)}"
+    return f"{type(e).__name__}: {e}"
+
+
 class GradioApp:
     """Gradio web interface for YouTube RAG Chatbot"""
-    
-    def __init__(self):
-        """Initialize chatbot and cleanup manager"""
-        self.chatbot = YouTubeChatbot()
-        self.cleanup_manager = DBCleanupManager(
-            Config.BASE_DB_DIR,
-            Config.RUN_ID
-        )
-    
-    def add_video_ui(self, video_url: str, progress=gr.Progress()) -> str:
+
+    # Max number of question -> answer pairs kept in the response cache
+    RESPONSE_CACHE_SIZE = 1024
+
+    # Semantic cache: reuse answers for near-duplicate questions
+    SEMANTIC_CACHE_SIZE = 256
+    SEMANTIC_CACHE_THRESHOLD = 0.95
+    SEMANTIC_CACHE_BITS = 16  # LSH hash width (random hyperplanes)
+
+    # How long (seconds) storage stats stay fresh before re-walking disk
+    STORAGE_STATS_TTL = 30
+
+    # Full turns kept in the chat history; older turns are compacted into
+    # a single summary entry so per-turn payloads stay bounded
+    MAX_HISTORY_TURNS = 50
+
+    def __init__(self, chatbot: YouTubeChatbot = None):
+        """
+        Initialize caches; heavy subsystems are created lazily
+
+        Args:
+            chatbot: Optional pre-built chatbot to reuse (e.g. from the CLI)
+        """
+        if chatbot is not None:
+            _SHARED["chatbot"] = chatbot
+
+        # Exact-match LRU cache for chat responses (question -> answer).
+        # Repeat questions skip the LLM + vector search entirely.
+        self._response_cache = OrderedDict()
+
+        # Semantic cache: LSH buckets of (unit-norm embedding, answer)
+        # pairs. Hashing with random hyperplanes keeps lookups bounded to
+        # one bucket (plus Hamming-1 neighbors) instead of a full matmul
+        # that grows with the cache size.
+        self._lsh_buckets = {}
+        self._lsh_order = []  # FIFO of (bucket_key, entry) for eviction
+        self._lsh_proj = None  # (d, bits) projection, built on first use
+
+        # Cached storage stats markdown: (monotonic timestamp, output)
+        self._storage_cache = (0.0, None)
+
+        # Prewarm heavy subsystems off the main thread so the first real
+        # request doesn't pay model-load / Chroma-open / disk-walk costs
+        if Config.WARMUP:
+            threading.Thread(target=self._warmup, daemon=True).start()
+
+    def _warmup(self):
+        """Force lazy initialization of the embedding model, Chroma and stats"""
+        try:
+            self.chatbot.embed("warmup")
+            self.chatbot.vector_store.similarity_search("warmup", k=1)
+            self.cleanup_manager.get_storage_stats()
+            print("🔥 Warmup complete")
+        except Exception as e:
+            print(f"⚠️ Warmup failed (first request will initialize instead): {e}")
+
+    @cached_property
+    def chatbot(self) -> YouTubeChatbot:
+        """Shared chatbot instance, built on first use"""
+        if _SHARED["chatbot"] is None:
+            _SHARED["chatbot"] = YouTubeChatbot()
+        return _SHARED["chatbot"]
+
+    @cached_property
+    def cleanup_manager(self) -> DBCleanupManager:
+        """Shared cleanup manager instance, built on first use"""
+        if _SHARED["cleanup_manager"] is None:
+            _SHARED["cleanup_manager"] = DBCleanupManager(
+                Config.BASE_DB_DIR,
+                Config.RUN_ID
+            )
+        return _SHARED["cleanup_manager"]
+
+
+    async def add_video_ui(self, video_url: str, progress=gr.Progress()) -> str:
         """
         Add video through Gradio UI
         
@@ -27,31 +184,47 @@ class GradioApp:
         Returns:
             Status message
         """
-        if not video_url or not video_url.strip():
+        urls = [line.strip() for line in (video_url or "").splitlines() if line.strip()]
+        if not urls:
             return "❌ Please enter a valid YouTube URL"
-        
+
         try:
             progress(0, desc="Starting...")
-            
-            progress(0.2, desc="Fetching transcript...")
-            result = self.chatbot.add_video(video_url)
-            
+
+            progress(0.2, desc=f"Fetching {len(urls)} transcript(s)...")
+            result = await asyncio.to_thread(self.chatbot.add_videos_batch, urls)
+
             if result['success']:
+                # New content changes answers, so cached responses are stale
+                self._response_cache.clear()
+                self._lsh_buckets.clear()
+                self._lsh_order = []
                 progress(1.0, desc="Complete!")
-                return f"""✅ Video added successfully!
-                
-📹 Video ID: {result['video_id']}
-📊 Chunks created: {result['chunks_added']}
-📝 Total characters: {result['stats']['total_characters']}
 
-You can now ask questions about this video!"""
+                output = f"""✅ Added {len(result['videos'])} video(s) successfully!
+
+📊 Total chunks created: {result['chunks_added']}
+"""
+                for video in result['videos']:
+                    output += f"\n📹 {video['video_id']} — {video['chunks']} chunks"
+
+                if result['errors']:
+                    output += f"\n\n⚠️ {len(result['errors'])} video(s) failed:"
+                    for error in result['errors']:
+                        output += f"\n  • {error['url']}: {error['error']}"
+
+                output += "\n\nYou can now ask questions about these videos!"
+                return output
             else:
-                return f"❌ Error: {result['error']}"
-                
+                errors = "\n".join(
+                    f"  • {error['url']}: {error['error']}" for error in result['errors']
+                )
+                return f"❌ No videos could be added:\n{errors}"
+
         except Exception as e:
-            return f"❌ Error: {str(e)}\n\n{traceback.format_exc()}"
+            return f"❌ Error: {_fmt_exc(e)}"
     
-    def chat_interface(self, message: str, history: List[Tuple[str, str]]) -> Tuple[List[Tuple[str, str]], str]:
+    async def chat_interface(self, message: str, history: List[Tuple[str, str]]) -> Tuple[List[Tuple[str, str]], str]:
         """
         Handle chat messages
         
@@ -63,26 +236,166 @@ You can now ask questions about this video!"""
             Updated history and empty string for input
         """
         if not message or not message.strip():
-            return history, ""
-        
+            yield history, ""
+            return
+
         try:
-            # Get answer from chatbot
-            response = self.chatbot.ask(message, show_sources=True)
-            
-            # Update history
-            history.append((message, response))
-            
-            return history, ""
-            
+            # Check the exact-match cache first (case-insensitive)
+            cache_key = message.strip().lower()
+            if cache_key in self._response_cache:
+                self._response_cache.move_to_end(cache_key)
+                history.append((message, self._response_cache[cache_key]))
+                yield self._compact_history(history), ""
+                return
+
+            # Then check the semantic cache for a near-duplicate question
+            q_vec = np.asarray(
+                await asyncio.to_thread(self.chatbot.embed, message),
+                dtype=np.float32
+            )
+            norm = np.linalg.norm(q_vec)
+            if norm > 0:
+                q_vec /= norm
+
+            cached = self._semantic_cache_lookup(q_vec)
+            if cached is not None:
+                history.append((message, cached))
+                yield self._compact_history(history), ""
+                return
+
+            # Stream the answer so tokens show up as they arrive
+            history.append((message, ""))
+            response = ""
+            stream = self.chatbot.ask_stream(message, show_sources=True)
+            while True:
+                partial = await asyncio.to_thread(next, stream, None)
+                if partial is None:
+                    break
+                response = partial
+                history[-1] = (message, response)
+                yield history, ""
+
+            self._semantic_cache_store(q_vec, response)
+
+            # Cache the response, evicting the least recently used entry
+            self._response_cache[cache_key] = response
+            if len(self._response_cache) > self.RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+
+            yield self._compact_history(history), ""
+
         except Exception as e:
             error_msg = f"❌ Error: {str(e)}"
-            history.append((message, error_msg))
-            return history, ""
+            # A mid-stream failure already has this message as the last
+            # history row (appended before streaming began) — replace it
+            # rather than appending the question a second time
+            if history and history[-1][0] == message:
+                history[-1] = (message, error_msg)
+            else:
+                history.append((message, error_msg))
+            yield history, ""
     
-    def get_stats_ui(self) -> str:
+    def _compact_history(self, history: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """
+        Bound chat history so per-turn payloads stay flat
+
+        Gradio re-serializes the full history to the client on every
+        submit, so unbounded growth makes long sessions O(N²) in bytes
+        sent. Turns beyond MAX_HISTORY_TURNS are folded into a single
+        synthetic summary entry (plain string templating, no LLM call).
+        """
+        if len(history) <= self.MAX_HISTORY_TURNS:
+            return history
+
+        overflow = history[:-self.MAX_HISTORY_TURNS]
+
+        lines = []
+        for question, answer in overflow:
+            if question is None:
+                # Previous summary entry: keep its content
+                lines.append(answer)
+            else:
+                lines.append(f"Q: {question}")
+
+        summary = (
+            f"📜 Earlier conversation ({len(overflow)} turn(s) compacted):\n"
+            + "\n".join(lines)
+        )
+
+        return [(None, summary)] + history[-self.MAX_HISTORY_TURNS:]
+
+    def _lsh_key(self, q_vec: np.ndarray) -> int:
+        """Hash an embedding into an LSH bucket key (packed sign bits)"""
+        if self._lsh_proj is None:
+            # Fixed seed so the same question always hashes to the same
+            # bucket across the lifetime of the process
+            rng = np.random.default_rng(42)
+            self._lsh_proj = rng.standard_normal(
+                (q_vec.shape[0], self.SEMANTIC_CACHE_BITS)
+            ).astype(np.float32)
+
+        bits = (q_vec @ self._lsh_proj) >= 0
+        key = 0
+        for bit in bits:
+            key = (key << 1) | int(bit)
+        return key
+
+    def _semantic_cache_lookup(self, q_vec: np.ndarray):
+        """
+        Return a cached answer for a semantically similar question, or None
+
+        Only the query's own LSH bucket and its Hamming-distance-1
+        neighbors are scanned, so lookup cost stays flat as the cache grows.
+
+        Args:
+            q_vec: Unit-normalized query embedding
+
+        Returns:
+            Cached answer string if similarity >= threshold, else None
+        """
+        if not self._lsh_order:
+            return None
+
+        key = self._lsh_key(q_vec)
+        candidate_keys = [key] + [key ^ (1 << i) for i in range(self.SEMANTIC_CACHE_BITS)]
+
+        best_sim = -1.0
+        best_answer = None
+        for candidate in candidate_keys:
+            for vec, answer in self._lsh_buckets.get(candidate, ()):
+                sim = float(vec @ q_vec)
+                if sim > best_sim:
+                    best_sim = sim
+                    best_answer = answer
+
+        if best_sim >= self.SEMANTIC_CACHE_THRESHOLD:
+            return best_answer
+
+        return None
+
+    def _semantic_cache_store(self, q_vec: np.ndarray, answer: str):
+        """Store a (question embedding, answer) pair with FIFO eviction"""
+        key = self._lsh_key(q_vec)
+        entry = (q_vec, answer)
+
+        self._lsh_buckets.setdefault(key, []).append(entry)
+        self._lsh_order.append((key, entry))
+
+        # Evict the oldest entry once the cache is full
+        if len(self._lsh_order) > self.SEMANTIC_CACHE_SIZE:
+            old_key, old_entry = self._lsh_order.pop(0)
+            bucket = self._lsh_buckets.get(old_key, [])
+            for i, existing in enumerate(bucket):
+                if existing is old_entry:
+                    del bucket[i]
+                    break
+            if not bucket:
+                self._lsh_buckets.pop(old_key, None)
+
+    async def get_stats_ui(self) -> str:
         """Get knowledge base statistics for UI"""
         try:
-            stats = self.chatbot.get_stats()
+            stats = await asyncio.to_thread(self.chatbot.get_stats)
             
             output = f"""📊 **Knowledge Base Statistics**
 
@@ -106,10 +419,15 @@ You can now ask questions about this video!"""
         """Clear chat history"""
         return [], ""
     
-    def get_storage_stats_ui(self) -> str:
+    async def get_storage_stats_ui(self) -> str:
         """Get storage statistics for UI"""
         try:
-            stats = self.cleanup_manager.get_storage_stats()
+            # Serve cached output while it's fresh to avoid re-walking disk
+            cached_at, cached_output = self._storage_cache
+            if cached_output is not None and time.monotonic() - cached_at < self.STORAGE_STATS_TTL:
+                return cached_output
+
+            stats = await asyncio.to_thread(self.cleanup_manager.get_storage_stats)
             
             output = f"""📊 **Database Storage Statistics**
 
@@ -134,16 +452,17 @@ You can now ask questions about this video!"""
             output += f"\n**Retention Policy:** {Config.CLEANUP_RETENTION_MODE}\n"
             output += f"- Keep runs from last {Config.CLEANUP_RETENTION_DAYS} days\n"
             output += f"- Keep last {Config.CLEANUP_RETENTION_COUNT} runs\n"
-            
+
+            self._storage_cache = (time.monotonic(), output)
             return output
-            
+
         except Exception as e:
-            return f"❌ Error fetching storage stats: {str(e)}\n\n{traceback.format_exc()}"
+            return f"❌ Error fetching storage stats: {_fmt_exc(e)}"
     
-    def cleanup_preview_ui(self) -> str:
+    async def cleanup_preview_ui(self) -> str:
         """Preview what will be deleted"""
         try:
-            result = self.cleanup_manager.cleanup_old_runs(dry_run=True)
+            result = await asyncio.to_thread(self.cleanup_manager.cleanup_old_runs, dry_run=True)
             
             if result['deleted_count'] == 0:
                 return "✅ No runs to delete based on current retention policy.\n\nAll runs are within the retention period."
@@ -162,23 +481,26 @@ Will delete **{result['deleted_count']} run(s)**:
             return output
             
         except Exception as e:
-            return f"❌ Error previewing cleanup: {str(e)}\n\n{traceback.format_exc()}"
+            return f"❌ Error previewing cleanup: {_fmt_exc(e)}"
     
-    def cleanup_execute_ui(self, progress=gr.Progress()) -> str:
+    async def cleanup_execute_ui(self, progress=gr.Progress()) -> str:
         """Execute cleanup"""
         try:
             progress(0, desc="Starting cleanup...")
             
             # First check if there's anything to delete
-            preview = self.cleanup_manager.cleanup_old_runs(dry_run=True)
+            preview = await asyncio.to_thread(self.cleanup_manager.cleanup_old_runs, dry_run=True)
             if preview['deleted_count'] == 0:
                 return "✅ No runs to delete. All runs are within retention policy."
             
             progress(0.3, desc=f"Deleting {preview['deleted_count']} run(s)...")
             
             # Execute cleanup
-            result = self.cleanup_manager.cleanup_old_runs(dry_run=False)
-            
+            result = await asyncio.to_thread(self.cleanup_manager.cleanup_old_runs, dry_run=False)
+
+            # Deleting runs changes storage numbers immediately
+            self._storage_cache = (0.0, None)
+
             progress(1.0, desc="Complete!")
             
             output = f"""✅ **Cleanup Complete!**
@@ -201,37 +523,15 @@ Will delete **{result['deleted_count']} run(s)**:
             return output
             
         except Exception as e:
-            return f"❌ Error during cleanup: {str(e)}\n\n{traceback.format_exc()}"
+            return f"❌ Error during cleanup: {_fmt_exc(e)}"
     
     def launch(self, share: bool = False):
         """Launch Gradio interface"""
         
-        # Custom CSS
-        custom_css = """
-        .gradio-container {
-            font-family: 'Arial', sans-serif;
-        }
-        .chat-message {
-            padding: 10px;
-            border-radius: 10px;
-        }
-        """
-        
         # Create Gradio interface
-        with gr.Blocks(css=custom_css, title="YouTube RAG Chatbot") as demo:
+        with gr.Blocks(css=_CSS, title="YouTube RAG Chatbot") as demo:
             
-            gr.Markdown(
-                """
-                # 🤖 YouTube RAG Chatbot
-                
-                ### Ask questions about YouTube videos using AI!
-                
-                **How to use:**
-                1. Add YouTube video URLs in the "Add Videos" tab
-                2. Go to "Chat" tab and ask questions
-                3. Check "Statistics" for knowledge base info
-                """
-            )
+            gr.Markdown(_HEADER_MD)
             
             with gr.Tabs():
                 
@@ -241,9 +541,9 @@ Will delete **{result['deleted_count']} run(s)**:
                     
                     with gr.Row():
                         video_input = gr.Textbox(
-                            label="YouTube Video URL",
-                            placeholder="https://www.youtube.com/watch?v=...",
-                            lines=1
+                            label="YouTube Video URL(s)",
+                            placeholder="https://www.youtube.com/watch?v=...\n(one URL per line)",
+                            lines=8
                         )
                     
                     with gr.Row():
@@ -260,7 +560,8 @@ Will delete **{result['deleted_count']} run(s)**:
                     add_btn.click(
                         fn=self.add_video_ui,
                         inputs=[video_input],
-                        outputs=[video_output]
+                        outputs=[video_output],
+                        concurrency_limit=1  # embedding calls serialize anyway
                     )
                     
                     clear_input_btn.click(
@@ -268,24 +569,13 @@ Will delete **{result['deleted_count']} run(s)**:
                         outputs=[video_input]
                     )
                     
-                    gr.Markdown(
-                        """
-                        **Tips:**
-                        - Videos must have English transcripts available
-                        - Processing may take 30-60 seconds depending on video length
-                        - You can add multiple videos one at a time
-                        """
-                    )
+                    gr.Markdown(_TIPS_MD)
                 
                 # Tab 2: Chat
                 with gr.Tab("💬 Chat"):
                     gr.Markdown("### Ask Questions About Your Videos")
                     
-                    chatbot_ui = gr.Chatbot(
-                        label="Conversation",
-                        height=400,
-                        type="tuples"  # Explicitly set to avoid warning
-                    )
+                    chatbot_ui = gr.Chatbot(**_CHATBOT_KWARGS)
                     
                     with gr.Row():
                         msg_input = gr.Textbox(
@@ -303,13 +593,15 @@ Will delete **{result['deleted_count']} run(s)**:
                     submit_btn.click(
                         fn=self.chat_interface,
                         inputs=[msg_input, chatbot_ui],
-                        outputs=[chatbot_ui, msg_input]
+                        outputs=[chatbot_ui, msg_input],
+                        concurrency_limit=2 * Config.UI_CONCURRENCY  # LLM calls can overlap
                     )
                     
                     msg_input.submit(
                         fn=self.chat_interface,
                         inputs=[msg_input, chatbot_ui],
-                        outputs=[chatbot_ui, msg_input]
+                        outputs=[chatbot_ui, msg_input],
+                        concurrency_limit=2 * Config.UI_CONCURRENCY
                     )
                     
                     clear_btn.click(
@@ -317,15 +609,7 @@ Will delete **{result['deleted_count']} run(s)**:
                         outputs=[chatbot_ui, msg_input]
                     )
                     
-                    gr.Markdown(
-                        """
-                        **Example Questions:**
-                        - What is this video about?
-                        - Summarize the main points
-                        - What did they say about [topic]?
-                        - Compare the information from different videos
-                        """
-                    )
+                    gr.Markdown(_EXAMPLES_MD)
                 
                 # Tab 3: Statistics
                 with gr.Tab("📊 Statistics"):
@@ -337,11 +621,16 @@ Will delete **{result['deleted_count']} run(s)**:
                     
                     refresh_btn.click(
                         fn=self.get_stats_ui,
-                        outputs=[stats_output]
+                        outputs=[stats_output],
+                        concurrency_limit=16  # cheap read-only lookups
                     )
                     
-                    # Load stats on tab open
+                    # Load stats on tab open: render a placeholder first so
+                    # the UI is interactive immediately, then fill in stats
                     demo.load(
+                        fn=lambda: "⏳ Loading statistics...",
+                        outputs=[stats_output]
+                    ).then(
                         fn=self.get_stats_ui,
                         outputs=[stats_output]
                     )
@@ -350,12 +639,7 @@ Will delete **{result['deleted_count']} run(s)**:
                 with gr.Tab("🧹 Cleanup"):
                     gr.Markdown("### Database Storage Management")
                     
-                    gr.Markdown(
-                        """
-                        Manage old database runs to free up disk space. Each application run creates a new 
-                        timestamped database folder. Use this tab to view storage usage and clean up old runs.
-                        """
-                    )
+                    gr.Markdown(_CLEANUP_INTRO_MD)
                     
                     # Storage Stats Section
                     with gr.Group():
@@ -377,38 +661,32 @@ Will delete **{result['deleted_count']} run(s)**:
                         
                         cleanup_result_output = gr.Markdown()
                     
-                    gr.Markdown(
-                        """
-                        **How it works:**
-                        1. Click "Preview Cleanup" to see what will be deleted
-                        2. Review the list of runs to be deleted
-                        3. Click "Confirm Cleanup" to proceed with deletion
-                        
-                        **Retention Policy:**
-                        - The current run is always protected
-                        - Runs are kept based on configured retention settings
-                        - See CLEANUP.md for configuration details
-                        """
-                    )
+                    gr.Markdown(_CLEANUP_HELP_MD)
                     
                     # Button actions
                     refresh_storage_btn.click(
                         fn=self.get_storage_stats_ui,
-                        outputs=[storage_stats_output]
+                        outputs=[storage_stats_output],
+                        concurrency_limit=16
                     )
                     
                     preview_cleanup_btn.click(
                         fn=self.cleanup_preview_ui,
-                        outputs=[cleanup_preview_output]
+                        outputs=[cleanup_preview_output],
+                        concurrency_limit=16
                     )
                     
                     execute_cleanup_btn.click(
                         fn=self.cleanup_execute_ui,
-                        outputs=[cleanup_result_output]
+                        outputs=[cleanup_result_output],
+                        concurrency_limit=1  # never delete runs concurrently
                     )
                     
-                    # Load storage stats on tab open
+                    # Load storage stats on tab open (deferred, same as above)
                     demo.load(
+                        fn=lambda: "⏳ Loading storage statistics...",
+                        outputs=[storage_stats_output]
+                    ).then(
                         fn=self.get_storage_stats_ui,
                         outputs=[storage_stats_output]
                     )
@@ -418,7 +696,11 @@ Will delete **{result['deleted_count']} run(s)**:
         print("\n" + "="*80)
         print("🚀 LAUNCHING GRADIO INTERFACE")
         print("="*80 + "\n")
-        
+
+        # Bound the request queue so slow handlers can't block the UI and
+        # burst load stays within predictable memory limits
+        demo.queue(default_concurrency_limit=Config.UI_CONCURRENCY, max_size=64)
+
         demo.launch(share=share, server_name="0.0.0.0", server_port=7860)
 
 
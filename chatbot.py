@@ -1,28 +1,118 @@
+import os
+import sys
+import hashlib
+import logging
+import logging.handlers
+import numpy as np
 from youtube_loader import YouTubeLoader
 from text_processor import TextProcessor
-from vector_store import VectorStore
+from vector_store import get_vector_store
 from rag_engine import RAGEngine
 from config import Config
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List
 
+logger = logging.getLogger(__name__)
+
+
+def _configure_logging():
+    """
+    Route progress output through one buffered logger
+
+    Records accumulate in a MemoryHandler and flush to stdout in batches
+    of up to 100 (or immediately on WARNING and above), so progress
+    logging costs one write() per batch instead of one per line. Message
+    arguments use %-style lazy formatting, so they are never rendered
+    when a record is filtered out.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return  # already configured by the host application
+
+    target = logging.StreamHandler(sys.stdout)
+    target.setFormatter(logging.Formatter("%(message)s"))
+    root.addHandler(logging.handlers.MemoryHandler(
+        capacity=100,
+        flushLevel=logging.WARNING,
+        target=target
+    ))
+    root.setLevel(logging.INFO)
+
+
+def _flush_logs():
+    """
+    Push buffered log records to the terminal now
+
+    The MemoryHandler only drains on WARNING or a full buffer, so every
+    flow that ends at an input() prompt (or returns control to the CLI)
+    flushes explicitly first — otherwise a successful ingest would sit
+    silently in the buffer while the user stares at a prompt.
+    """
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
+
 class YouTubeChatbot:
     """Main chatbot class orchestrating all components"""
-    
+
+    # Batch ingest embeds accumulated chunks once this many are pending,
+    # so embedding overlaps with transcript fetches still in flight
+    EMBED_FLUSH_CHUNKS = 256
+
+    # Single-video ingest streams chunks into the embedder in batches of
+    # this size instead of materializing the whole documents list
+    STREAM_EMBED_BATCH = 64
+
+
     def __init__(self):
         """Initialize all components"""
-        print("\n" + "="*80)
-        print("INITIALIZING YOUTUBE RAG CHATBOT")
-        print("="*80 + "\n")
-        
+        _configure_logging()
+
+        logger.info("\n%s", "="*80)
+        logger.info("INITIALIZING YOUTUBE RAG CHATBOT")
+        logger.info("%s\n", "="*80)
+
+        # Single validation point (was previously run at config import)
+        Config.validate()
+
         self.youtube_loader = YouTubeLoader()
         self.text_processor = TextProcessor()
-        self.vector_store = VectorStore()
+        self.vector_store = get_vector_store()
         self.rag_engine = RAGEngine()
         
-        print("\n" + "="*80)
-        print("CHATBOT READY!")
-        print("="*80 + "\n")
+        logger.info("\n%s", "="*80)
+        logger.info("CHATBOT READY!")
+        logger.info("%s\n", "="*80)
+        _flush_logs()
     
+    def _embedding_cache_path(self, video_id: str) -> str:
+        """
+        Cache file path keyed on video + chunking + embedding settings
+
+        Every setting that changes get_embeddings output is part of the
+        digest — precision and dimension truncation included — so a
+        settings change can never serve vectors of the wrong width or
+        dtype from a previous run's cache.
+        """
+        cfg = (
+            f"{Config.CHUNK_SIZE}_{Config.CHUNK_OVERLAP}_{Config.EMBEDDING_MODEL}"
+            f"_{Config.EMBEDDING_PRECISION}_{Config.EMBEDDING_DIM_TRUNCATE}"
+        )
+        digest = hashlib.md5(cfg.encode()).hexdigest()[:12]
+        return os.path.join(Config.EMBEDDINGS_CACHE_DIR, f"{video_id}_{digest}.npz")
+
+    def _load_cached_embeddings(self, cache_path: str):
+        """Load (texts, vectors) from the cache file, or None on any miss"""
+        if not os.path.exists(cache_path):
+            return None
+        try:
+            cached = np.load(cache_path)
+            texts = [str(text) for text in cached['texts']]
+            return texts, cached['vecs']
+        except Exception as e:
+            logger.warning("⚠️ Could not read embedding cache %s: %s", cache_path, e)
+            return None
+
     def add_video(self, video_url: str) -> dict:
         """
         Add a YouTube video to the knowledge base
@@ -34,8 +124,8 @@ class YouTubeChatbot:
             Dictionary with status and statistics
         """
         try:
-            print(f"\n📥 Processing video: {video_url}")
-            print("-" * 80)
+            logger.info("\n📥 Processing video: %s", video_url)
+            logger.info("-" * 80)
             
             # Step 1: Get transcript
             video_data = self.youtube_loader.get_transcript(video_url)
@@ -43,32 +133,55 @@ class YouTubeChatbot:
             
             # Step 2: Save transcript
             self.youtube_loader.save_transcript(video_data)
-            
-            # Step 3: Split into chunks
-            documents = self.text_processor.split_text(
-                text=video_data['transcript'],
-                metadata={
-                    'video_id': video_id,
-                    'url': video_data['url'],
-                    "title": video_data["title"],
+
+            metadata = {
+                'video_id': video_id,
+                'url': video_data['url'],
+                "title": video_data["title"],
+            }
+
+            # Step 3: Chunk, embed and store. A cache hit pushes saved
+            # vectors straight in; otherwise chunks stream through the
+            # embedder in fixed-size batches.
+            cache_path = self._embedding_cache_path(video_id)
+            cached = self._load_cached_embeddings(cache_path)
+
+            if cached is not None:
+                texts, embeddings = cached
+                logger.info("⚡ Embedding cache hit for %s (%d chunks)",
+                            video_id, len(texts))
+                # SoA path: stats and storage both work straight off the
+                # text list, so no per-chunk dicts are built at all
+                sizes = [len(text) for text in texts]
+                stats = {
+                    'total_chunks': len(texts),
+                    'avg_chunk_size': sum(sizes) / len(sizes),
+                    'min_chunk_size': min(sizes),
+                    'max_chunk_size': max(sizes),
+                    'total_characters': sum(sizes)
                 }
-            )
-            
-            # Step 4: Get chunk statistics
-            stats = self.text_processor.get_chunk_stats(documents)
-            print(f"\nChunk Statistics:")
-            print(f"  Total chunks: {stats['total_chunks']}")
-            print(f"  Avg size: {stats['avg_chunk_size']:.0f} chars")
-            print(f"  Min/Max: {stats['min_chunk_size']}/{stats['max_chunk_size']} chars")
-            
-            # Step 5: Add to vector store
-            num_added = self.vector_store.add_documents(documents, video_id)
-            
-            print(f"\n✅ Video processed successfully!")
-            print(f"   Video ID: {video_id}")
-            print(f"   Chunks added: {num_added}")
-            print("-" * 80)
+                num_added = self.vector_store.add_documents_soa(
+                    texts, video_id, title=metadata["title"],
+                    embeddings=embeddings
+                )
+            else:
+                stats, num_added = self._stream_ingest(
+                    video_data['transcript'], metadata, cache_path
+                )
+
+            # Step 4: Report chunk statistics
+            logger.info("\nChunk Statistics:")
+            logger.info("  Total chunks: %d", stats['total_chunks'])
+            logger.info("  Avg size: %.0f chars", stats['avg_chunk_size'])
+            logger.info("  Min/Max: %d/%d chars",
+                        stats['min_chunk_size'], stats['max_chunk_size'])
             
+            logger.info("\n✅ Video processed successfully!")
+            logger.info("   Video ID: %s", video_id)
+            logger.info("   Chunks added: %d", num_added)
+            logger.info("-" * 80)
+            _flush_logs()
+
             return {
                 'success': True,
                 'video_id': video_id,
@@ -78,38 +191,204 @@ class YouTubeChatbot:
             }
             
         except Exception as e:
-            print(f"\n❌ Error processing video: {str(e)}")
+            logger.error("\n❌ Error processing video: %s", str(e))
             return {
                 'success': False,
                 'error': str(e)
             }
     
+    def _stream_ingest(self, transcript: str, metadata: dict,
+                       cache_path: str) -> tuple:
+        """
+        Chunk, embed and store a transcript in one streaming pass
+
+        Chunks flow from the splitter straight into fixed-size embedding
+        batches, so peak memory is one batch of documents rather than the
+        whole video, and stats come from a running aggregate instead of a
+        second walk over the list.
+
+        Returns:
+            Tuple of (chunk stats dict, number of chunks added)
+        """
+        count = 0
+        size_sum = 0
+        size_min = None
+        size_max = 0
+        num_added = 0
+        batch = []
+        cache_texts = []
+        cache_vecs = []
+
+        def flush(batch):
+            embeddings = self.rag_engine.llm.get_embeddings(
+                [doc['text'] for doc in batch]
+            )
+            cache_texts.extend(doc['text'] for doc in batch)
+            cache_vecs.append(np.asarray(embeddings, dtype='<f4'))
+            return self.vector_store.add_documents_batch(batch, embeddings=embeddings)
+
+        for doc in self.text_processor.iter_split(transcript, metadata):
+            batch.append(doc)
+            size = doc['chunk_size']
+            count += 1
+            size_sum += size
+            size_min = size if size_min is None else min(size_min, size)
+            size_max = max(size_max, size)
+
+            if len(batch) >= self.STREAM_EMBED_BATCH:
+                num_added += flush(batch)
+                batch = []
+
+        if batch:
+            num_added += flush(batch)
+
+        if cache_vecs:
+            try:
+                np.savez_compressed(
+                    cache_path,
+                    texts=np.array(cache_texts),
+                    vecs=np.vstack(cache_vecs)
+                )
+            except Exception as e:
+                logger.warning("⚠️ Could not write embedding cache: %s", e)
+
+        stats = {
+            'total_chunks': count,
+            'avg_chunk_size': size_sum / count if count else 0,
+            'min_chunk_size': size_min or 0,
+            'max_chunk_size': size_max,
+            'total_characters': size_sum
+        }
+        return stats, num_added
+
+    def add_videos_batch(self, video_urls: List[str]) -> dict:
+        """
+        Add several videos through a fetch/embed pipeline
+
+        Transcripts download concurrently; as each one completes it is
+        chunked and accumulated, and whenever enough chunks are pending
+        they are embedded and stored in one batch while the remaining
+        fetches are still in flight. Wall time approaches
+        max(fetch time / workers, embed time) instead of their sum.
+
+        Args:
+            video_urls: List of YouTube video URLs or IDs
+
+        Returns:
+            Dictionary with added videos, errors and total chunks added
+        """
+        added = []
+        errors = []
+        pending = []
+        chunks_added = 0
+
+        def fetch_and_save(url):
+            # Persisting the transcript on the worker thread keeps the
+            # consumer loop free for chunking and embedding
+            video_data = self.youtube_loader.get_transcript(url)
+            self.youtube_loader.save_transcript(video_data)
+            return video_data
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {
+                executor.submit(fetch_and_save, url): url
+                for url in video_urls
+            }
+
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    video_data = future.result()
+                except Exception as e:
+                    errors.append({'url': url, 'error': str(e)})
+                    continue
+
+                # Chunking failures (e.g. an empty transcript) are
+                # per-video errors too: record them and keep going so
+                # one bad video never discards the rest of the batch
+                try:
+                    documents = self.text_processor.split_text(
+                        text=video_data['transcript'],
+                        metadata={
+                            'video_id': video_data['video_id'],
+                            'url': video_data['url'],
+                            "title": video_data["title"],
+                        }
+                    )
+                except Exception as e:
+                    errors.append({'url': url, 'error': str(e)})
+                    continue
+
+                pending.extend(documents)
+                added.append({
+                    'video_id': video_data['video_id'],
+                    'url': video_data['url'],
+                    'input_url': url,
+                    'chunks': len(documents)
+                })
+
+                # Embed while remaining downloads are still running
+                if len(pending) >= self.EMBED_FLUSH_CHUNKS:
+                    chunks_added += self.vector_store.add_documents_batch(pending)
+                    pending = []
+
+        if pending:
+            chunks_added += self.vector_store.add_documents_batch(pending)
+
+        return {
+            'success': bool(added),
+            'videos': added,
+            'errors': errors,
+            'chunks_added': chunks_added
+        }
+
     def add_multiple_videos(self, video_urls: List[str]) -> List[dict]:
         """
         Add multiple videos to the knowledge base
-        
+
+        All transcripts are fetched and chunked first, then every chunk
+        across every video is embedded in one batched call, instead of
+        paying the encoder overhead video-by-video.
+
         Args:
             video_urls: List of YouTube video URLs
-            
+
         Returns:
             List of results for each video
         """
+        logger.info("\n%s", "="*80)
+        logger.info("PROCESSING %d VIDEO(S) IN ONE BATCH", len(video_urls))
+        logger.info("="*80)
+
+        batch = self.add_videos_batch(video_urls)
+
+        added_by_input = {video['input_url']: video for video in batch['videos']}
+        error_by_input = {error['url']: error['error'] for error in batch['errors']}
+
         results = []
-        
-        for i, url in enumerate(video_urls, 1):
-            print(f"\n{'='*80}")
-            print(f"PROCESSING VIDEO {i}/{len(video_urls)}")
-            print(f"{'='*80}")
-            
-            result = self.add_video(url)
-            results.append(result)
-        
+        for url in video_urls:
+            if url in added_by_input:
+                video = added_by_input[url]
+                results.append({
+                    'success': True,
+                    'video_id': video['video_id'],
+                    'url': video['url'],
+                    'chunks_added': video['chunks']
+                })
+            else:
+                results.append({
+                    'success': False,
+                    'error': error_by_input.get(url, 'Unknown error')
+                })
+
         # Summary
         successful = sum(1 for r in results if r.get('success'))
-        print(f"\n{'='*80}")
-        print(f"SUMMARY: {successful}/{len(video_urls)} videos processed successfully")
-        print(f"{'='*80}\n")
-        
+        logger.info("\n%s", "="*80)
+        logger.info("SUMMARY: %d/%d videos processed successfully",
+                    successful, len(video_urls))
+        logger.info("%s\n", "="*80)
+        _flush_logs()
+
         return results
     
     def ask(self, question: str, show_sources: bool = False) -> str:
@@ -124,18 +403,59 @@ class YouTubeChatbot:
             Answer string
         """
         result = self.rag_engine.query(question, include_sources=show_sources)
-        
+
         answer = result['answer']
-        
+
         if show_sources and result.get('sources'):
-            answer += "\n\n📚 Sources:\n"
-            for source in result['sources']:
-                answer += f"\n{source['source_number']}. Video: {source['video_id']} "
-                answer += f"(Similarity: {source['similarity']:.2%})\n"
-                answer += f"   URL: {source['url']}\n"
-        
+            answer += self._format_source_block(result['sources'])
+
         return answer
+
+    @staticmethod
+    def _format_source_block(sources) -> str:
+        """Render the 📚 Sources block with one join instead of += growth"""
+        parts = ["\n\n📚 Sources:\n"]
+        for source in sources:
+            parts.append(
+                f"\n{source['source_number']}. Video: {source['video_id']} "
+                f"(Similarity: {source['similarity']:.2%})\n"
+                f"   URL: {source['url']}\n"
+            )
+        return "".join(parts)
     
+    def ask_stream(self, question: str, show_sources: bool = False):
+        """
+        Stream the answer to a question
+
+        Yields the accumulated answer text as it arrives so UIs can
+        render tokens incrementally. The sources block (if requested) is
+        appended in the final yield.
+
+        Args:
+            question: User question
+            show_sources: Whether to append sources after the answer
+        """
+        answer = ""
+        sources = []
+
+        for event in self.rag_engine.query_stream(question, include_sources=show_sources):
+            if event['type'] == 'delta':
+                answer += event['text']
+                yield answer
+            elif event['type'] == 'sources':
+                sources = event['sources']
+
+        if show_sources and sources:
+            answer += self._format_source_block(sources)
+            yield answer
+
+    def embed(self, text: str):
+        """Embed a piece of text with the same model used for retrieval
+
+        Returns a float32 numpy vector.
+        """
+        return self.rag_engine.llm.get_embeddings(text)[0]
+
     def get_stats(self) -> dict:
         """Get statistics about the knowledge base"""
         return self.vector_store.get_collection_stats()
@@ -150,6 +470,7 @@ class YouTubeChatbot:
     
     def chat_loop(self):
         """Interactive chat loop in terminal"""
+        _flush_logs()  # drain any buffered progress before prompting
         print("\n" + "="*80)
         print("YOUTUBE RAG CHATBOT - Interactive Mode")
         print("="*80)
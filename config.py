@@ -10,12 +10,15 @@ class Config:
 
     # === Groq settings ===
     GROQ_API_KEY = os.getenv("GROQ_API_KEY")
-    if not GROQ_API_KEY:
-        raise ValueError("GROQ_API_KEY not found in environment variables")
 
     # === Model settings ===
     LLM_MODEL = "openai/gpt-oss-120b"  # Groq model
     EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2")
+    # "float32" (default) or "int8" to quarter embedding storage/bandwidth
+    EMBEDDING_PRECISION = os.getenv("EMBEDDING_PRECISION", "float32")
+    # Keep only the first N embedding dimensions (renormalized); 0 keeps
+    # the model's full dimensionality
+    EMBEDDING_DIM_TRUNCATE = int(os.getenv("EMBEDDING_DIM_TRUNCATE", 0))
 
     # === LLM parameters ===
     TEMPERATURE = 0.7
@@ -27,6 +30,14 @@ class Config:
     RUN_ID = datetime.now().strftime("%Y%m%d_%H%M%S")
     CHROMA_DB_PATH = os.path.join(BASE_DB_DIR, f"run_{RUN_ID}")
     COLLECTION_NAME = "youtube_transcripts"
+    # Rows per collection.add call; Chroma insert throughput peaks
+    # around this batch size
+    CHROMA_BATCH_SIZE = int(os.getenv("CHROMA_BATCH_SIZE", 250))
+    # HNSW index shape: M controls graph degree (recall/memory),
+    # construction_ef build-time effort, search_ef query-time effort
+    HNSW_M = int(os.getenv("HNSW_M", 32))
+    HNSW_EF_CONSTRUCTION = int(os.getenv("HNSW_EF_CONSTRUCTION", 200))
+    HNSW_EF_SEARCH = int(os.getenv("HNSW_EF_SEARCH", 50))
 
     # === Text Processing ===
     CHUNK_SIZE = int(os.getenv("CHUNK_SIZE", 1000))
@@ -34,9 +45,24 @@ class Config:
 
     # === Retrieval ===
     TOP_K_RESULTS = 4
+    # Coalesce concurrent query encodes into one model.encode call
+    # (useful under multi-user UI load; adds up to ~10ms latency)
+    MICROBATCH_ENABLED = os.getenv("MICROBATCH_ENABLED", "false").lower() == "true"
 
     # === Data Storage ===
     TRANSCRIPTS_DIR = "./data/transcripts"
+    EMBEDDINGS_CACHE_DIR = "./data/embeddings_cache"
+
+    # === Debug ===
+    DEBUG = os.getenv("DEBUG", "false").lower() == "true"
+
+    # === UI ===
+    # Default Gradio queue workers; the chat endpoint runs at twice this
+    UI_CONCURRENCY = int(os.getenv("UI_CONCURRENCY", 4))
+
+    # === Warmup ===
+    # Prewarm embedding model, Chroma and storage stats in the UI
+    WARMUP = os.getenv("WARMUP", "true").lower() == "true"
 
     # === Cleanup Configuration ===
     CLEANUP_ENABLED = os.getenv("CLEANUP_ENABLED", "true").lower() == "true"
@@ -46,15 +72,18 @@ class Config:
 
     @staticmethod
     def validate():
-        """Validate required config and create necessary directories"""
+        """
+        Validate required config and create necessary directories
+
+        Called once from YouTubeChatbot.__init__ rather than at import
+        time, so importing this module never touches the filesystem or
+        raises when GROQ_API_KEY is absent (e.g. during testing).
+        """
         if not Config.GROQ_API_KEY:
             raise ValueError("GROQ_API_KEY not found in environment variables")
 
         os.makedirs(Config.TRANSCRIPTS_DIR, exist_ok=True)
+        os.makedirs(Config.EMBEDDINGS_CACHE_DIR, exist_ok=True)
         os.makedirs(Config.CHROMA_DB_PATH, exist_ok=True)
         print(f"[Config] ✅ Chroma path initialized at: {Config.CHROMA_DB_PATH}")
         return True
-
-
-# Validate on import
-Config.validate()
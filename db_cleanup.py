@@ -1,9 +1,17 @@
 import os
+import re
 import shutil
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
 from config import Config
 
+logger = logging.getLogger(__name__)
+
+# Matches run_YYYYMMDD_HHMMSS folder names, capturing the timestamp
+_RUN_DIR_RE = re.compile(r"run_(\d{8}_\d{6})")
+
 
 class DBCleanupManager:
     """Manage cleanup of old ChromaDB run folders"""
@@ -24,10 +32,16 @@ class DBCleanupManager:
         self.retention_days = Config.CLEANUP_RETENTION_DAYS
         self.retention_count = Config.CLEANUP_RETENTION_COUNT
         self.retention_mode = Config.CLEANUP_RETENTION_MODE
-        
-        print(f"🧹 DBCleanupManager initialized")
-        print(f"   Mode: {self.retention_mode}")
-        print(f"   Retention: {self.retention_days} days OR {self.retention_count} runs")
+
+        # Memo of folder sizes: path -> (top-level mtime, size_bytes).
+        # A run's subtree is only re-walked when its directory mtime
+        # changes, so repeat stats calls skip unchanged runs.
+        self._size_cache = {}
+
+        logger.info("🧹 DBCleanupManager initialized")
+        logger.info("   Mode: %s", self.retention_mode)
+        logger.info("   Retention: %d days OR %d runs",
+                    self.retention_days, self.retention_count)
 
     def get_all_runs(self) -> List[Dict[str, Any]]:
         """
@@ -38,84 +52,122 @@ class DBCleanupManager:
         """
         if not os.path.exists(self.base_db_dir):
             return []
-        
-        runs = []
-        
+
+        # Collect run_YYYYMMDD_HHMMSS folders in a single scandir pass:
+        # each DirEntry answers is_dir() from the directory read itself,
+        # so there is no stat() per name, and one fullmatch replaces the
+        # startswith/slice/match dance
+        entries = []
         try:
-            for folder_name in os.listdir(self.base_db_dir):
-                folder_path = os.path.join(self.base_db_dir, folder_name)
-                
-                # Skip if not a directory
-                if not os.path.isdir(folder_path):
-                    continue
-                
-                # Parse run_YYYYMMDD_HHMMSS pattern
-                if not folder_name.startswith("run_"):
-                    continue
-                
-                run_id = folder_name[4:]  # Remove "run_" prefix
-                
-                # Parse timestamp
-                try:
-                    created_time = datetime.strptime(run_id, "%Y%m%d_%H%M%S")
-                except ValueError:
-                    # Invalid format, skip
-                    continue
-                
-                # Calculate age
-                age = datetime.now() - created_time
-                age_days = age.total_seconds() / 86400  # Convert to days
-                
-                runs.append({
-                    'path': folder_path,
-                    'run_id': run_id,
-                    'created_time': created_time,
-                    'age_days': age_days,
-                    'is_current': run_id == self.current_run_id
-                })
-        
+            with os.scandir(self.base_db_dir) as it:
+                for entry in it:
+                    match = _RUN_DIR_RE.fullmatch(entry.name)
+                    if match is None:
+                        continue
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    entries.append((match.group(1), entry.path))
+
         except Exception as e:
-            print(f"⚠️ Error scanning runs directory: {e}")
+            logger.warning("⚠️ Error scanning runs directory: %s", e)
             return []
-        
+
+        if not entries:
+            return []
+
+        # Parse timestamps per entry so one folder with digit-shaped
+        # but out-of-range fields (month 13, hour 25, ...) is skipped
+        # with a warning instead of hiding every run
+        now = datetime.now()
+        runs = []
+        for run_id, folder_path in entries:
+            try:
+                created_time = datetime.strptime(run_id, "%Y%m%d_%H%M%S")
+            except ValueError:
+                logger.warning("⚠️ Skipping run folder with invalid timestamp: %s",
+                               folder_path)
+                continue
+
+            runs.append({
+                'path': folder_path,
+                'run_id': run_id,
+                'created_time': created_time,
+                'age_days': (now - created_time).total_seconds() / 86400.0,
+                'is_current': run_id == self.current_run_id
+            })
+
         # Sort by created_time (newest first)
         runs.sort(key=lambda x: x['created_time'], reverse=True)
-        
+
         return runs
 
     def calculate_folder_size(self, folder_path: str) -> int:
         """
         Calculate total size of folder in bytes
-        
+
+        Uses os.scandir so each entry's stat data comes from the
+        directory read itself — far fewer syscalls than os.walk plus
+        os.path.getsize on run folders with thousands of segment files.
+        Symlinks are never followed.
+
         Args:
             folder_path: Path to folder
-            
+
         Returns:
             Size in bytes
         """
         total_size = 0
-        
+
         try:
-            for dirpath, dirnames, filenames in os.walk(folder_path):
-                for filename in filenames:
-                    file_path = os.path.join(dirpath, filename)
-                    
-                    # Skip symlinks to avoid following external data
-                    if os.path.islink(file_path):
-                        continue
-                    
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
                     try:
-                        total_size += os.path.getsize(file_path)
+                        if entry.is_file(follow_symlinks=False):
+                            total_size += entry.stat(follow_symlinks=False).st_size
+                        elif entry.is_dir(follow_symlinks=False):
+                            total_size += self.calculate_folder_size(entry.path)
                     except (OSError, FileNotFoundError):
-                        # File may have been deleted or inaccessible
+                        # Entry may have been deleted or inaccessible
                         continue
-        
+
         except Exception as e:
-            print(f"⚠️ Error calculating size for {folder_path}: {e}")
+            logger.warning("⚠️ Error calculating size for %s: %s", folder_path, e)
             return 0
-        
+
         return total_size
 
+    def _folder_size_cached(self, folder_path: str) -> int:
+        """
+        Get folder size, reusing the cached value when the folder is unchanged
+
+        The current run is always re-walked: its files grow in place,
+        which never bumps the folder's own mtime, so the cache would
+        hold its startup size forever. Old runs are immutable and the
+        mtime check only has to catch their deletion.
+
+        Args:
+            folder_path: Path to folder
+
+        Returns:
+            Size in bytes
+        """
+        if os.path.basename(folder_path) == f"run_{self.current_run_id}":
+            return self.calculate_folder_size(folder_path)
+
+        try:
+            mtime = os.path.getmtime(folder_path)
+        except OSError:
+            self._size_cache.pop(folder_path, None)
+            return 0
+
+        cached = self._size_cache.get(folder_path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        size = self.calculate_folder_size(folder_path)
+        self._size_cache[folder_path] = (mtime, size)
+        return size
+
     def _format_bytes(self, bytes_size: int) -> str:
         """
         Convert bytes to human-readable format
@@ -132,62 +184,6 @@ class DBCleanupManager:
             bytes_size /= 1024.0
         return f"{bytes_size:.1f} PB"
 
-    def _get_runs_to_keep_by_count(self, runs: List[Dict[str, Any]]) -> set:
-        """
-        Get set of run_ids to keep based on count retention
-        
-        Args:
-            runs: List of run info dicts (should be sorted newest first)
-            
-        Returns:
-            Set of run_ids to keep
-        """
-        # Keep the N most recent runs
-        runs_to_keep = set()
-        for i, run in enumerate(runs):
-            if i < self.retention_count:
-                runs_to_keep.add(run['run_id'])
-        
-        return runs_to_keep
-
-    def should_delete_run(self, run_info: dict, runs_to_keep_by_count: set = None) -> bool:
-        """
-        Determine if a run should be deleted based on retention policy
-        
-        Args:
-            run_info: Run metadata dict
-            runs_to_keep_by_count: Pre-calculated set of run_ids to keep by count
-            
-        Returns:
-            True if should delete, False otherwise
-        """
-        # Never delete current run
-        if run_info['is_current']:
-            return False
-        
-        run_id = run_info['run_id']
-        age_days = run_info['age_days']
-        
-        # Apply retention policy based on mode
-        if self.retention_mode == "days":
-            # Keep only if within retention days
-            return age_days > self.retention_days
-        
-        elif self.retention_mode == "count":
-            # Keep only if in top N runs
-            return run_id not in runs_to_keep_by_count
-        
-        elif self.retention_mode == "hybrid":
-            # Keep if EITHER condition is satisfied (more permissive)
-            keep_by_days = age_days <= self.retention_days
-            keep_by_count = run_id in runs_to_keep_by_count
-            return not (keep_by_days or keep_by_count)
-        
-        else:
-            # Unknown mode, don't delete
-            print(f"⚠️ Unknown retention mode: {self.retention_mode}")
-            return False
-
     def cleanup_old_runs(self, dry_run: bool = False) -> Dict[str, Any]:
         """
         Delete old runs according to retention policy
@@ -208,55 +204,78 @@ class DBCleanupManager:
                 'deleted_runs': []
             }
         
-        # Pre-calculate runs to keep by count (for efficiency)
-        runs_to_keep_by_count = self._get_runs_to_keep_by_count(runs)
-        
         deleted_count = 0
         space_freed = 0
         errors = []
         deleted_runs = []
-        
-        for run in runs:
-            # Check if should delete
-            if not self.should_delete_run(run, runs_to_keep_by_count):
-                continue
-            
-            # Calculate size before deletion
-            size = self.calculate_folder_size(run['path'])
-            
-            if dry_run:
-                # Just report, don't delete
-                deleted_count += 1
-                space_freed += size
-                deleted_runs.append(run['run_id'])
+
+        # Collect deletion candidates in one pass over the newest-first
+        # list: the position decides count retention and a precomputed
+        # threshold decides age retention, so there are no per-run set
+        # lookups or mode re-dispatch. Sizes are cached across the
+        # dry-run preview and the real pass, so each tree is walked once.
+        age_threshold = datetime.now() - timedelta(days=self.retention_days)
+        mode = self.retention_mode
+
+        candidates = []
+        for i, run in enumerate(runs):
+            # Never delete current run
+            if run['is_current']:
                 continue
-            
-            # Attempt deletion with error handling
-            try:
-                shutil.rmtree(run['path'])
+
+            old_by_days = run['created_time'] < age_threshold
+            old_by_count = i >= self.retention_count
+
+            if mode == "days":
+                delete = old_by_days
+            elif mode == "count":
+                delete = old_by_count
+            elif mode == "hybrid":
+                # Keep if EITHER condition is satisfied (more permissive)
+                delete = old_by_days and old_by_count
+            else:
+                logger.warning("⚠️ Unknown retention mode: %s", mode)
+                break
+
+            if delete:
+                candidates.append((run, self._folder_size_cached(run['path'])))
+
+        if dry_run:
+            # Just report, don't delete
+            for run, size in candidates:
                 deleted_count += 1
                 space_freed += size
                 deleted_runs.append(run['run_id'])
-                print(f"   Deleted: {run['run_id']} ({self._format_bytes(size)})")
-            
-            except OSError as e:
-                # Handle permission denied, folder in use, etc.
-                error_msg = f"Failed to delete {run['run_id']}: {str(e)}"
-                errors.append({
-                    'run_id': run['run_id'],
-                    'error': str(e)
-                })
-                print(f"   ⚠️ {error_msg}")
-            
-            except Exception as e:
-                # Catch any other errors
-                error_msg = f"Unexpected error deleting {run['run_id']}: {str(e)}"
-                errors.append({
-                    'run_id': run['run_id'],
-                    'error': str(e)
-                })
-                print(f"   ⚠️ {error_msg}")
-        
+        elif candidates:
+            # Delete runs concurrently: removal is unlink/rmdir
+            # syscall-bound and releases the GIL, so overlapping the
+            # trees cuts wall time on multi-run cleanups
+            def _delete_run(item):
+                run, size = item
+                try:
+                    shutil.rmtree(run['path'])
+                    return run, size, None
+                except Exception as e:
+                    return run, size, e
+
+            with ThreadPoolExecutor(max_workers=min(8, len(candidates))) as executor:
+                for run, size, error in executor.map(_delete_run, candidates):
+                    if error is None:
+                        deleted_count += 1
+                        space_freed += size
+                        deleted_runs.append(run['run_id'])
+                        self._size_cache.pop(run['path'], None)
+                        logger.info("   Deleted: %s (%s)",
+                                    run['run_id'], self._format_bytes(size))
+                    else:
+                        # Permission denied, folder in use, etc.
+                        errors.append({
+                            'run_id': run['run_id'],
+                            'error': str(error)
+                        })
+                        logger.warning("   ⚠️ Failed to delete %s: %s",
+                                       run['run_id'], str(error))
+
         return {
             'deleted_count': deleted_count,
             'space_freed_bytes': space_freed,
@@ -283,10 +302,17 @@ class DBCleanupManager:
                 'current_run': self.current_run_id
             }
         
-        # Calculate size for each run
+        # Calculate sizes concurrently; each walk is stat-bound I/O that
+        # releases the GIL, so runs scan in parallel (cached folders are
+        # answered instantly)
+        with ThreadPoolExecutor(max_workers=min(16, len(runs))) as executor:
+            sizes = list(executor.map(
+                self._folder_size_cached,
+                (run['path'] for run in runs)
+            ))
+
         total_size = 0
-        for run in runs:
-            size = self.calculate_folder_size(run['path'])
+        for run, size in zip(runs, sizes):
             run['size_bytes'] = size
             run['size_human'] = self._format_bytes(size)
             total_size += size
@@ -0,0 +1,118 @@
+import os
+import sqlite3
+import hashlib
+import logging
+import threading
+from typing import Callable, List
+
+import numpy as np
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """Persistent content-hash -> embedding cache backed by SQLite"""
+
+    # IN (...) queries are issued in slices below SQLite's parameter limit
+    LOOKUP_SLICE = 500
+
+    def __init__(self, path: str = None):
+        """
+        Open (or create) the cache database
+
+        Lives at BASE_DB_DIR/emb_cache.sqlite so it survives run-folder
+        cleanup and is shared by every run. Vectors are stored as raw
+        float16 bytes — half the disk and page-cache footprint of
+        float32 for a negligible cosine-ranking difference.
+        """
+        self.path = path or os.path.join(Config.BASE_DB_DIR, "emb_cache.sqlite")
+        self._lock = threading.Lock()
+        self._conn = None
+
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS emb (hash BLOB PRIMARY KEY, vec BLOB)"
+            )
+            self._conn.commit()
+        except Exception as e:
+            logger.warning("⚠️ Embedding cache unavailable: %s", e)
+            self._conn = None
+
+    @staticmethod
+    def _key(text: str, tag: bytes) -> bytes:
+        """Content hash; the tag folds in model/settings identity"""
+        return hashlib.blake2b(tag + text.encode(), digest_size=16).digest()
+
+    def get_or_compute(self, texts: List[str], tag: bytes,
+                       encoder_fn: Callable) -> np.ndarray:
+        """
+        Return embeddings for texts, encoding only uncached ones
+
+        Args:
+            texts: Chunk texts to embed
+            tag: Bytes identifying the embedding settings (model name,
+                dimension truncation, ...)
+            encoder_fn: Called with the list of cache-miss texts; must
+                return one vector row per text in order
+
+        Returns:
+            Contiguous float32 ndarray, one row per input text
+        """
+        if self._conn is None:
+            return encoder_fn(texts)
+
+        keys = [self._key(text, tag) for text in texts]
+
+        found = {}
+        try:
+            with self._lock:
+                for start in range(0, len(keys), self.LOOKUP_SLICE):
+                    batch = list(set(keys[start:start + self.LOOKUP_SLICE]))
+                    marks = ",".join("?" * len(batch))
+                    for key, raw in self._conn.execute(
+                        f"SELECT hash, vec FROM emb WHERE hash IN ({marks})",
+                        batch
+                    ):
+                        found[key] = raw
+        except Exception as e:
+            logger.warning("⚠️ Embedding cache lookup failed: %s", e)
+            return encoder_fn(texts)
+
+        rows = [None] * len(texts)
+        miss_idx = []
+        for i, key in enumerate(keys):
+            raw = found.get(key)
+            if raw is not None:
+                rows[i] = np.frombuffer(raw, dtype=np.float16).astype(np.float32)
+            else:
+                miss_idx.append(i)
+
+        if miss_idx:
+            misses = np.asarray(encoder_fn([texts[i] for i in miss_idx]))
+
+            to_store = []
+            for j, i in enumerate(miss_idx):
+                vec = np.ascontiguousarray(misses[j], dtype=np.float32)
+                rows[i] = vec
+                to_store.append(
+                    (keys[i], np.asarray(vec, dtype=np.float16).tobytes())
+                )
+
+            # One transaction for the whole batch; failures only cost
+            # the caching, never the ingest
+            try:
+                with self._lock:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO emb (hash, vec) VALUES (?, ?)",
+                        to_store
+                    )
+                    self._conn.commit()
+            except Exception as e:
+                logger.warning("⚠️ Embedding cache write failed: %s", e)
+
+        return np.ascontiguousarray(np.vstack(rows), dtype=np.float32)
@@ -1,23 +1,90 @@
+import os
+import threading
+import httpx
+import numpy as np
+
+# Let the HF fast tokenizer fan tokenization out across cores in Rust
+# (outside the GIL) instead of running it on the single encode thread.
+# transformers disables this by default after fork; opt back in unless
+# the environment says otherwise.
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "true")
+
 from groq import Groq
 from sentence_transformers import SentenceTransformer
 from typing import List, Dict, Union
 from config import Config
 
+# Process-wide model cache: loading deserializes ~90 MB of weights and
+# initializes torch, so pay that cost once no matter how many LLMWrapper
+# instances (chatbot, vector store, ...) are created.
+_MODEL_CACHE: Dict[str, SentenceTransformer] = {}
+_MODEL_LOCK = threading.Lock()
+
+
+def _get_model(name: str) -> SentenceTransformer:
+    """Return a cached SentenceTransformer, loading it on first use"""
+    with _MODEL_LOCK:
+        model = _MODEL_CACHE.get(name)
+        if model is None:
+            import torch
+
+            model = SentenceTransformer(name)
+            model.eval()
+
+            # fp16 halves embedding latency on GPU with negligible recall loss
+            if torch.cuda.is_available():
+                model = model.half().to("cuda")
+
+            # Prime tokenizer and kernel caches before the first real request
+            model.encode(["warmup"], show_progress_bar=False)
+
+            _MODEL_CACHE[name] = model
+    return model
+
+
 class LLMWrapper:
     """Wrapper for LLM and embedding models"""
-    
+
     def __init__(self):
-        # Initialize Groq
-        self.groq_client = Groq(api_key=Config.GROQ_API_KEY)
-        
-        # Initialize embedding model
-        self.embedding_model = SentenceTransformer(Config.EMBEDDING_MODEL)
+        # Initialize Groq with a persistent keep-alive HTTP client so
+        # completion calls reuse TCP/TLS connections instead of paying a
+        # handshake per request
+        self._http_client = httpx.Client(
+            timeout=httpx.Timeout(60.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=16,
+                keepalive_expiry=120
+            )
+        )
+        self.groq_client = Groq(
+            api_key=Config.GROQ_API_KEY,
+            http_client=self._http_client
+        )
+
+        # Initialize embedding model (shared across instances); expose
+        # its tokenizer for callers that want token-level inspection
+        self.embedding_model = _get_model(Config.EMBEDDING_MODEL)
+        self.tokenizer = self.embedding_model.tokenizer
         
         print(f"✓ LLM initialized (using Groq {Config.LLM_MODEL})")
         print(f"✓ Embeddings initialized (using {Config.EMBEDDING_MODEL})")
+
+    def __del__(self):
+        try:
+            self._http_client.close()
+        except Exception:
+            pass
     
-    def get_completion(self, messages: List[Dict[str, str]], stream: bool = True) -> str:
-        """Get completion from Groq"""
+    def get_completion(self, messages: List[Dict[str, str]], stream: bool = True,
+                       write_callback=None) -> str:
+        """
+        Get completion from Groq
+
+        When streaming, deltas are collected in a list and joined once at
+        the end instead of being printed per token (a syscall per delta).
+        Pass write_callback to observe output incrementally; it receives
+        buffered text flushed on newlines or every 32 deltas.
+        """
         try:
             completion = self.groq_client.chat.completions.create(
                 model=Config.LLM_MODEL,
@@ -31,24 +98,122 @@ class LLMWrapper:
             )
             
             if stream:
-                full_response = ""
+                parts = []
+                pending = []
                 for chunk in completion:
                     content = chunk.choices[0].delta.content or ""
-                    full_response += content
-                    print(content, end="", flush=True)
-                return full_response
+                    if not content:
+                        continue
+                    parts.append(content)
+
+                    if write_callback is not None:
+                        pending.append(content)
+                        if len(pending) >= 32 or "\n" in content:
+                            write_callback("".join(pending))
+                            pending.clear()
+
+                if write_callback is not None and pending:
+                    write_callback("".join(pending))
+
+                return "".join(parts)
             else:
                 return completion.choices[0].message.content
                 
         except Exception as e:
             raise Exception(f"Groq API error: {str(e)}")
     
-    def get_embeddings(self, texts: Union[str, List[str]]) -> List[List[float]]:
-        """Get embeddings using SentenceTransformer"""
+    def stream_completion(self, messages: List[Dict[str, str]]):
+        """Stream completion text from Groq, yielding each delta as it arrives"""
+        try:
+            completion = self.groq_client.chat.completions.create(
+                model=Config.LLM_MODEL,
+                messages=messages,
+                temperature=Config.TEMPERATURE,
+                max_completion_tokens=Config.MAX_TOKENS,
+                top_p=1,
+                reasoning_effort=Config.REASONING_EFFORT,
+                stream=True,
+                stop=None
+            )
+
+            for chunk in completion:
+                content = chunk.choices[0].delta.content or ""
+                if content:
+                    yield content
+
+        except Exception as e:
+            raise Exception(f"Groq API error: {str(e)}")
+
+    def get_embeddings(self, texts: Union[str, List[str]], batch_size: int = 64) -> np.ndarray:
+        """
+        Get embeddings using SentenceTransformer
+
+        Texts are encoded in length-sorted order so each batch pads to
+        similar sizes (less wasted compute), then restored to input order.
+
+        Vectors come back unit-normalized (normalize_embeddings=True),
+        so cosine similarity reduces to a plain dot product downstream —
+        HNSW's cosine metric and the RAM-mirror matmul both skip the two
+        norm computations per comparison.
+
+        Args:
+            texts: Single text or list of texts to embed
+            batch_size: Encoder batch size
+
+        Returns:
+            Contiguous float32 ndarray of shape (N, d). ChromaDB accepts
+            ndarrays directly, so the result is never boxed into Python
+            floats.
+        """
         try:
             if isinstance(texts, str):
                 texts = [texts]
-            embeddings = self.embedding_model.encode(texts)
-            return embeddings.tolist()
+
+            # Sort by length so batches carry minimal padding
+            order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+            sorted_texts = [texts[i] for i in order]
+
+            embeddings = self.embedding_model.encode(
+                sorted_texts,
+                batch_size=batch_size,
+                show_progress_bar=False,
+                convert_to_numpy=True,
+                normalize_embeddings=True
+            )
+
+            # Restore the caller's ordering in one scatter
+            restored = np.empty_like(embeddings)
+            restored[order] = embeddings
+
+            # Optional dimension truncation: keep the leading N dims and
+            # renormalize so cosine scores stay on the unit sphere.
+            # Storage, index and matmul cost all scale linearly with the
+            # kept width. Applies to documents and queries alike since
+            # both embed through this method.
+            dim = Config.EMBEDDING_DIM_TRUNCATE
+            if dim and dim < restored.shape[1]:
+                restored = restored[:, :dim]
+                norms = np.linalg.norm(restored, axis=1, keepdims=True)
+                norms[norms == 0] = 1.0
+                restored = restored / norms
+
+            # Optional int8 quantization: 4x fewer bytes per vector at a
+            # small recall cost (cosine ranking is largely preserved).
+            # Calibration ranges are fixed at [-1, 1] — every component
+            # of a unit-normalized vector lies there — so all calls map
+            # to the same scale. Letting quantize_embeddings calibrate
+            # per batch would give each call its own scale (breaking
+            # comparability across calls) and divide by zero on
+            # single-text queries, where per-dimension min == max.
+            if Config.EMBEDDING_PRECISION == "int8":
+                from sentence_transformers.quantization import quantize_embeddings
+                arr = np.ascontiguousarray(restored, dtype=np.float32)
+                ranges = np.vstack([
+                    np.full(arr.shape[1], -1.0, dtype=np.float32),
+                    np.full(arr.shape[1], 1.0, dtype=np.float32)
+                ])
+                return quantize_embeddings(arr, precision="int8", ranges=ranges)
+
+            return np.ascontiguousarray(restored, dtype=np.float32)
         except Exception as e:
             raise Exception(f"Embedding error: {str(e)}")
\ No newline at end of file
@@ -1,11 +1,68 @@
 import sys
 import argparse
-from chatbot import YouTubeChatbot
-from typing import List
 
-def main():
-    """Main entry point for YouTube RAG Chatbot CLI"""
-    
+# Recognized top-level commands; the first one present in argv decides
+# which branch (and therefore which imports) main() materializes
+_COMMANDS = (
+    '--add', '--chat', '--stats', '--reset', '--delete', '--ui',
+    '--cleanup', '--cleanup-all', '--storage-stats'
+)
+
+
+# Pre-rendered copy of the parser's help output, so --help and bare
+# invocations never pay for ArgumentParser construction (keep in sync
+# with _build_parser below)
+_HELP_TEXT = """\
+usage: main.py [-h] [--add URL [URL ...]] [--chat] [--stats] [--reset]
+               [--delete VIDEO_ID] [--ui] [--share] [--cleanup]
+               [--cleanup-all] [--storage-stats]
+
+YouTube RAG Chatbot - Ask questions about YouTube videos
+
+options:
+  -h, --help           show this help message and exit
+  --add URL [URL ...]  Add YouTube video(s) to knowledge base
+  --chat               Start interactive chat session
+  --stats              Show knowledge base statistics
+  --reset              Reset the entire knowledge base
+  --delete VIDEO_ID    Delete a specific video from knowledge base
+  --ui                 Launch Gradio web interface
+  --share              Create public link for Gradio UI (use with --ui)
+  --cleanup            Clean up old database runs
+  --cleanup-all        Delete all runs except current (requires confirmation)
+  --storage-stats      Show storage statistics for database runs
+
+Examples:
+  # Add a video and start chatting
+  python main.py --add https://www.youtube.com/watch?v=VIDEO_ID
+
+  # Add multiple videos
+  python main.py --add URL1 URL2 URL3
+
+  # Start chat with existing knowledge base
+  python main.py --chat
+
+  # Show statistics
+  python main.py --stats
+
+  # Reset knowledge base
+  python main.py --reset
+
+  # Launch Gradio web UI
+  python main.py --ui
+"""
+
+
+def _sniff(argv):
+    """Return the first recognized command flag in argv, or None"""
+    for token in argv:
+        if token in _COMMANDS:
+            return token
+    return None
+
+
+def _build_parser():
+    """Construct the argument parser (deferred until a command needs it)"""
     parser = argparse.ArgumentParser(
         description="YouTube RAG Chatbot - Ask questions about YouTube videos",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -91,14 +148,31 @@ Examples:
         action='store_true',
         help='Show storage statistics for database runs'
     )
-    
-    args = parser.parse_args()
-    
-    # If no arguments provided, show help
-    if len(sys.argv) == 1:
+
+    return parser
+
+
+def main():
+    """Main entry point for YouTube RAG Chatbot CLI"""
+
+    # Help and bare invocations short-circuit on the static text before
+    # any parser (or heavier import) is constructed
+    if len(sys.argv) == 1 or sys.argv[1] in ('-h', '--help'):
+        print(_HELP_TEXT)
+        return
+
+    # Peek at argv before building anything: with no recognized command
+    # the parser exists only to reject unknown flags
+    command = _sniff(sys.argv[1:])
+
+    if command is None:
+        parser = _build_parser()
+        parser.parse_args()  # handles late -h/--help, errors otherwise
         parser.print_help()
         return
-    
+
+    args = _build_parser().parse_args()
+
     try:
         # Handle cleanup commands (don't need chatbot initialization)
         if args.cleanup or args.cleanup_all or args.storage_stats:
@@ -137,14 +211,17 @@ Examples:
                 result = cleanup_manager.manual_cleanup(delete_all=args.cleanup_all)
                 return
         
-        # Initialize chatbot
+        # Initialize chatbot (imported here so --help and the cleanup
+        # commands above never pay for the transitive chromadb /
+        # langchain / torch imports)
+        from chatbot import YouTubeChatbot
         chatbot = YouTubeChatbot()
         
         # Handle different commands
         if args.ui:
-            # Launch Gradio UI
+            # Launch Gradio UI, reusing the chatbot built above
             from app import GradioApp
-            app = GradioApp()
+            app = GradioApp(chatbot=chatbot)
             app.launch(share=args.share)
             return
         
@@ -1,6 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Tuple
 from llm_wrapper import LLMWrapper
-from vector_store import VectorStore
+from vector_store import get_vector_store
 from config import Config
 
 class RAGEngine:
@@ -9,8 +10,11 @@ class RAGEngine:
     def __init__(self):
         """Initialize RAG engine with LLM and vector store"""
         self.llm = LLMWrapper()
-        self.vector_store = VectorStore()
-        
+        self.vector_store = get_vector_store()
+
+        # Formats sources while the LLM call is in flight (see query)
+        self._format_pool = ThreadPoolExecutor(max_workers=1)
+
         # Define system prompt
         self.system_prompt = """You are a helpful AI assistant that answers questions based on YouTube video transcripts.
 
@@ -24,7 +28,12 @@ Instructions:
 Context from video transcripts:
 {context}
 """
-        
+
+        # Only {context} varies per request: split the template once so
+        # each call concatenates three strings instead of re-parsing the
+        # format template
+        self._sys_pre, _, self._sys_post = self.system_prompt.partition("{context}")
+
         print("✓ RAG Engine initialized")
     
     def retrieve_context(self, query: str, k: int = None) -> Tuple[str, List[dict]]:
@@ -34,28 +43,27 @@ Context from video transcripts:
         if not results:
             return "", []
         
-        context_parts = []
-        for i, result in enumerate(results, 1):
-            metadata = result.get('metadata') or {}
-            video_label = metadata.get('title') or metadata.get('video_id', 'unknown')
-            text = result['text']
-            context_parts.append(f"[Source {i} - {video_label}]\n{text}")
-        
-        formatted_context = "\n\n---\n\n".join(context_parts)
+        # One generator feeding join: no context_parts list and one
+        # f-string per source instead of append + label temporaries
+        formatted_context = "\n\n---\n\n".join(
+            f"[Source {i} - {meta.get('title') or meta.get('video_id', 'unknown')}]\n{result['text']}"
+            for i, (result, meta) in enumerate(
+                ((r, r.get('metadata') or {}) for r in results), 1
+            )
+        )
         return formatted_context, results
     
     def generate_answer(self, query: str, context: str) -> str:
         """Generate answer using LLM"""
         messages = [
-            {"role": "system", "content": self.system_prompt.format(context=context)},
+            {"role": "system", "content": self._sys_pre + context + self._sys_post},
             {"role": "user", "content": query}
         ]
         return self.llm.get_completion(messages)
     
     def query(self, question: str, include_sources: bool = True) -> dict:
         """Main query method - retrieve and generate answer"""
-        stats = self.vector_store.get_collection_stats()
-        if stats['total_documents'] == 0:
+        if self.vector_store.is_empty():
             return {
                 'answer': "No video transcripts have been loaded yet. Please add some YouTube videos first.",
                 'sources': []
@@ -69,26 +77,77 @@ Context from video transcripts:
                 'sources': []
             }
         
+        # Source formatting is pure Python and independent of the
+        # answer, so it runs on the side thread while the LLM round
+        # trip is in flight
+        future = (
+            self._format_pool.submit(self._format_sources, sources)
+            if include_sources else None
+        )
+
         answer = self.generate_answer(question, context)
         result = {'answer': answer}
-        
-        if include_sources:
-            formatted_sources = []
-            for i, source in enumerate(sources, 1):
-                metadata = source.get('metadata') or {}
-                video_label = metadata.get('title') or metadata.get('video_id')
-                formatted_sources.append({
-                    'source_number': i,
-                    'video_id': metadata.get('video_id'),
-                    'title': metadata.get('title'),
-                    'display': video_label,
-                    'url': metadata.get('source'),
-                    'similarity': round(source['similarity'], 3),
-                    'text_preview': source['text'][:200] + "..." if len(source['text']) > 200 else source['text']
-                })
-            result['sources'] = formatted_sources
-        
+
+        if future is not None:
+            result['sources'] = future.result()
+
         return result
+
+    def _format_sources(self, sources: List[dict]) -> List[dict]:
+        """Format raw search results into source dicts for display"""
+        formatted_sources = []
+        for i, source in enumerate(sources, 1):
+            # Hoist the per-source dict fields into locals so each is
+            # looked up once instead of per key below
+            metadata = source.get('metadata') or {}
+            video_id = metadata.get('video_id')
+            title = metadata.get('title')
+            text = source['text']
+            formatted_sources.append({
+                'source_number': i,
+                'video_id': video_id,
+                'title': title,
+                'display': title or video_id,
+                'url': metadata.get('source'),
+                'similarity': round(source['similarity'], 3),
+                'text_preview': text[:200] + "..." if len(text) > 200 else text
+            })
+        return formatted_sources
+
+    def query_stream(self, question: str, include_sources: bool = True):
+        """
+        Stream the answer to a question as it is generated
+
+        Yields:
+            {'type': 'delta', 'text': str} for each piece of the answer,
+            then {'type': 'sources', 'sources': [...]} after generation
+        """
+        if self.vector_store.is_empty():
+            yield {
+                'type': 'delta',
+                'text': "No video transcripts have been loaded yet. Please add some YouTube videos first."
+            }
+            return
+
+        context, sources = self.retrieve_context(question)
+
+        if not context:
+            yield {
+                'type': 'delta',
+                'text': "I couldn't find relevant information in the video transcripts to answer your question."
+            }
+            return
+
+        messages = [
+            {"role": "system", "content": self._sys_pre + context + self._sys_post},
+            {"role": "user", "content": question}
+        ]
+
+        for delta in self.llm.stream_completion(messages):
+            yield {'type': 'delta', 'text': delta}
+
+        if include_sources:
+            yield {'type': 'sources', 'sources': self._format_sources(sources)}
     
     def chat(self, question: str) -> str:
         """Simple chat method that returns just the answer"""
@@ -1,65 +1,117 @@
+import re
+import logging
+import numpy as np
 from typing import List
-from langchain_text_splitters import RecursiveCharacterTextSplitter  # Updated import
 from config import Config
 
+logger = logging.getLogger(__name__)
+
 class TextProcessor:
     """Process and chunk text for embedding"""
-    
+
     def __init__(self, chunk_size: int = None, chunk_overlap: int = None):
         """
         Initialize text processor
-        
+
         Args:
             chunk_size: Size of each text chunk
             chunk_overlap: Overlap between chunks
         """
         self.chunk_size = chunk_size or Config.CHUNK_SIZE
         self.chunk_overlap = chunk_overlap or Config.CHUNK_OVERLAP
-        
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=self.chunk_size,
-            chunk_overlap=self.chunk_overlap,
-            length_function=len,
-            separators=["\n\n", "\n", ". ", " ", ""]
+
+        # Candidate break points, same preference order the old
+        # recursive splitter used: paragraph, line, sentence, word
+        self._break_re = re.compile(r"\n\n|\n|\. | ")
+
+    def _chunk_spans(self, text: str):
+        """
+        Compute (start, end) chunk offsets in a single pass
+
+        All break candidates come from one re.finditer scan over the
+        text; np.searchsorted then picks the last break that fits each
+        chunk_size window. The loop runs once per chunk instead of the
+        recursive re-scanning the langchain splitter did per separator
+        level, which dominated ingest CPU on long transcripts.
+        """
+        n = len(text)
+        breaks = np.fromiter(
+            (m.end() for m in self._break_re.finditer(text)),
+            dtype=np.int64
         )
-    
-    def split_text(self, text: str, metadata: dict = None) -> List[dict]:
+
+        spans = []
+        pos = 0
+        while pos < n:
+            target = pos + self.chunk_size
+            if target >= n:
+                spans.append((pos, n))
+                break
+
+            # Last break ending inside the window, else a hard cut
+            idx = int(np.searchsorted(breaks, target, side='right')) - 1
+            end = int(breaks[idx]) if idx >= 0 and breaks[idx] > pos else target
+
+            spans.append((pos, end))
+
+            # Step back by the overlap, but always move forward
+            next_pos = end - self.chunk_overlap
+            pos = next_pos if next_pos > pos else end
+
+        return spans
+
+    def iter_split(self, text: str, metadata: dict = None):
         """
-        Split text into chunks with metadata
-        
+        Lazily split text into chunk documents
+
+        Yields one document dict at a time so callers can stream chunks
+        straight into the embedder without materializing the full list.
+
         Args:
             text: Text to split
             metadata: Additional metadata to attach to each chunk
-            
-        Returns:
-            List of dictionaries containing text chunks and metadata
         """
         if not text or not text.strip():
             raise ValueError("Text cannot be empty")
-        
-        # Split text into chunks
-        chunks = self.text_splitter.split_text(text)
-        
-        # Create documents with metadata
-        documents = []
-        for i, chunk in enumerate(chunks):
+
+        chunk_id = 0
+        for start, end in self._chunk_spans(text):
+            chunk = text[start:end].strip()
+            if not chunk:
+                continue
+
             doc = {
                 'text': chunk,
-                'chunk_id': i,
+                'chunk_id': chunk_id,
                 'chunk_size': len(chunk)
             }
-            
+
             # Add custom metadata
             if metadata:
                 doc.update(metadata)
-            
-            documents.append(doc)
-        
-        print(f"✓ Split text into {len(documents)} chunks")
-        print(f"  Chunk size: {self.chunk_size}, Overlap: {self.chunk_overlap}")
-        
+
+            yield doc
+            chunk_id += 1
+
+    def split_text(self, text: str, metadata: dict = None) -> List[dict]:
+        """
+        Split text into chunks with metadata
+
+        Args:
+            text: Text to split
+            metadata: Additional metadata to attach to each chunk
+
+        Returns:
+            List of dictionaries containing text chunks and metadata
+        """
+        documents = list(self.iter_split(text, metadata))
+
+        logger.debug("✓ Split text into %d chunks", len(documents))
+        logger.debug("  Chunk size: %d, Overlap: %d",
+                     self.chunk_size, self.chunk_overlap)
+
         return documents
-    
+
     def get_chunk_stats(self, documents: List[dict]) -> dict:
         """Get statistics about chunks"""
         if not documents:
@@ -1,18 +1,67 @@
 import os
 import time
+import queue
 import shutil
+import sqlite3
+import logging
+import threading
+import numpy as np
 import chromadb
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from chromadb.config import Settings
 from typing import List, Dict, Any
 from config import Config
+from embedding_cache import EmbeddingCache
 from llm_wrapper import LLMWrapper
 
+logger = logging.getLogger(__name__)
+
 
 class VectorStore:
     """Manage ChromaDB operations for storing and retrieving embeddings"""
 
+    # Above this corpus size the RAM mirror is skipped and searches fall
+    # back to Chroma's HNSW index
+    MAX_MATMUL_CORPUS = 1_000_000
+
+    # Texts are embedded in slices of this size so peak working memory
+    # during a long-video ingest stays bounded
+    EMBED_SLICE = 512
+
+    # Most-recent query embeddings kept for reuse (UI retries, repeated
+    # questions); each entry is one 384-dim float32 vector, so even the
+    # full cache stays under 2 MB
+    QUERY_EMBED_CACHE_SIZE = 1024
+
+    # Micro-batching (MICROBATCH_ENABLED): concurrent query encodes
+    # arriving within this window are coalesced into one encode call,
+    # flushing early once this many queries are waiting
+    MICROBATCH_WINDOW = 0.01
+    MICROBATCH_MAX = 16
+
     def __init__(self):
         self.llm_wrapper = LLMWrapper()
+        self._query_embed_cache = OrderedDict()
+
+        # Snapshot config read on per-call paths once; Config.X is a
+        # class-attribute walk per access and these never change after
+        # startup
+        self._collection_name = Config.COLLECTION_NAME
+        self._db_path = Config.CHROMA_DB_PATH
+        self._top_k = Config.TOP_K_RESULTS
+        self._chroma_batch = Config.CHROMA_BATCH_SIZE
+
+        # Chunk-level embedding cache shared across runs; the tag keys
+        # in the embedding settings so a model change never serves
+        # stale vectors. Disabled under int8 precision, whose rows the
+        # float16 storage cannot represent.
+        self._emb_cache_tag = (
+            f"{Config.EMBEDDING_MODEL}|{Config.EMBEDDING_DIM_TRUNCATE}".encode()
+        )
+        self._emb_cache = (
+            EmbeddingCache() if Config.EMBEDDING_PRECISION == "float32" else None
+        )
 
         # Cleanup old runs before initializing
         if Config.CLEANUP_ENABLED:
@@ -23,102 +72,551 @@ class VectorStore:
             )
             result = cleanup_manager.cleanup_old_runs()
             if result['deleted_count'] > 0:
-                print(f"🧹 Cleaned up {result['deleted_count']} old run(s) "
-                      f"({result['space_freed_human']} freed)")
+                logger.info("🧹 Cleaned up %d old run(s) (%s freed)",
+                            result['deleted_count'], result['space_freed_human'])
 
         # Each run uses a unique folder (defined in config)
         self.ensure_db_path_exists()
         self._initialize_db()
 
+        # Optional micro-batching of concurrent query encodes (see
+        # _microbatch_worker); off by default since it trades up to
+        # MICROBATCH_WINDOW of latency for batched encoder throughput
+        self._microbatch_queue = None
+        if Config.MICROBATCH_ENABLED:
+            self._microbatch_queue = queue.Queue()
+            threading.Thread(
+                target=self._microbatch_worker,
+                name="query-microbatch",
+                daemon=True
+            ).start()
+            logger.info("🧵 Query micro-batching enabled (window %.0fms, max %d)",
+                        self.MICROBATCH_WINDOW * 1000, self.MICROBATCH_MAX)
+
     def ensure_db_path_exists(self):
         """Ensure DB folder exists with writable permissions"""
-        os.makedirs(Config.CHROMA_DB_PATH, exist_ok=True)
+        os.makedirs(self._db_path, exist_ok=True)
 
         # Fix permissions if necessary
         try:
-            os.chmod(Config.CHROMA_DB_PATH, 0o777)
+            os.chmod(self._db_path, 0o777)
         except Exception as e:
-            print(f"⚠️ Could not chmod folder: {e}")
+            logger.warning("⚠️ Could not chmod folder: %s", e)
+
+        # Poll for writability instead of an unconditional 300ms sleep:
+        # on a healthy filesystem the first check passes and startup
+        # pays nothing; the deadline preserves the old worst case for
+        # slow mounts still settling after the chmod
+        deadline = time.monotonic() + 0.3
+        while not os.access(self._db_path, os.W_OK):
+            if time.monotonic() >= deadline:
+                raise PermissionError(f"🚫 Path not writable: {self._db_path}")
+            time.sleep(0.01)
+
+        logger.info("📁 Chroma DB directory ready: %s", self._db_path)
 
-        time.sleep(0.3)  # give filesystem time to settle
+    def _tune_sqlite(self):
+        """
+        Pre-tune Chroma's backing SQLite file for batch ingest
+
+        journal_mode=WAL persists in the database header, so setting it
+        before the client opens its own connections means every later
+        writer appends to the write-ahead log instead of rewriting a
+        rollback journal, and readers no longer block behind inserts.
+        Connection-scoped pragmas (synchronous, temp_store) cannot be
+        applied to Chroma's internal connections from the outside, so
+        they are left alone.
+        """
+        db_file = os.path.join(self._db_path, "chroma.sqlite3")
+        try:
+            conn = sqlite3.connect(db_file)
+            mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+            conn.close()
+            if str(mode).lower() != "wal":
+                logger.warning("⚠️ SQLite journal mode is %s, not WAL", mode)
+        except Exception as e:
+            logger.warning("⚠️ Could not tune Chroma SQLite file: %s", e)
 
-        if not os.access(Config.CHROMA_DB_PATH, os.W_OK):
-            raise PermissionError(f"🚫 Path not writable: {Config.CHROMA_DB_PATH}")
+    def _collection_metadata(self) -> Dict[str, Any]:
+        """
+        Collection metadata shared by create and get_or_create
 
-        print(f"📁 Chroma DB directory ready: {Config.CHROMA_DB_PATH}")
+        The hnsw:* keys size the index for this workload: a denser
+        graph (M) and higher construction effort cost a little ingest
+        time but keep recall high, while search_ef bounds query-time
+        candidate expansion.
+        """
+        return {
+            "hnsw:space": "cosine",
+            "hnsw:M": Config.HNSW_M,
+            "hnsw:construction_ef": Config.HNSW_EF_CONSTRUCTION,
+            "hnsw:search_ef": Config.HNSW_EF_SEARCH,
+            "dimension": 384
+        }
 
     def _initialize_db(self):
         """Initialize ChromaDB client"""
-        print(f"🚀 Initializing Chroma at: {Config.CHROMA_DB_PATH}")
+        logger.info("🚀 Initializing Chroma at: %s", self._db_path)
+
+        self._tune_sqlite()
 
         self.client = chromadb.PersistentClient(
-            path=Config.CHROMA_DB_PATH,
+            path=self._db_path,
             settings=Settings(anonymized_telemetry=False, allow_reset=True)
         )
 
         self.collection = self.client.get_or_create_collection(
-            name=Config.COLLECTION_NAME,
-            metadata={"hnsw:space": "cosine", "dimension": 384}
+            name=self._collection_name,
+            metadata=self._collection_metadata()
         )
 
-        print(f"✅ Fresh ChromaDB ready at: {Config.CHROMA_DB_PATH}")
-        print(f"   Collection: {Config.COLLECTION_NAME}")
-        print(f"   Docs: {self.collection.count()}")
+        logger.info("✅ Fresh ChromaDB ready at: %s", self._db_path)
+        logger.info("   Collection: %s", self._collection_name)
+        logger.info("   Docs: %d", self.collection.count())
+
+        self._load_corpus()
+
+    def _load_corpus(self):
+        """
+        Mirror the collection in RAM for single-matmul search
+
+        At the corpus sizes this app sees (well under a million chunks) a
+        dense `corpus @ query` BLAS call beats an HNSW traversal, so
+        similarity_search runs against this mirror and only falls back to
+        Chroma when the mirror is disabled.
+        """
+        self._corpus_vecs = None
+        self._corpus_texts = []
+        self._corpus_metas = []
+
+        # video_id -> chunk ids; None until the first stats call scans
+        # the collection, after which add/delete keep it current. Gives
+        # O(1) stats and spares delete_video the id-fetch round trip.
+        self._video_index = None
+
+        # Ids already in the collection, so _insert can drop re-added
+        # chunks the same way Chroma does instead of duplicating them
+        # in the mirror and counters; None when the corpus is too large
+        # to enumerate (mirror disabled), where Chroma dedupes alone
+        self._known_ids = set()
+
+        count = self.collection.count()
+        self._count_cache = count
+        self._matmul_enabled = count <= self.MAX_MATMUL_CORPUS
+        if count == 0:
+            return
+        if not self._matmul_enabled:
+            self._known_ids = None
+            return
+
+        batch = self.collection.get(include=["embeddings", "documents", "metadatas"])
+        self._known_ids.update(batch["ids"])
+        self._append_corpus(batch["embeddings"], batch["documents"], batch["metadatas"])
+        logger.info("🧮 In-memory search corpus loaded (%d vectors)", count)
 
-    def add_documents(self, documents: List[Dict[str, Any]], video_id: str) -> int:
-        """Add documents (chunks) to Chroma collection"""
+    def _append_corpus(self, embeddings, texts, metadatas):
+        """Add normalized vectors (plus texts/metadata) to the RAM mirror"""
+        if not self._matmul_enabled:
+            return
+
+        vecs = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(vecs, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        vecs = np.ascontiguousarray(vecs / norms)
+
+        # Publication order matters: searches run concurrently with the
+        # ingest writer thread and read the matrix first, then index
+        # into the lists. Extending the lists before swapping in the
+        # grown matrix means a racing search sees at worst the old,
+        # shorter matrix — never a row without its text/metadata.
+        self._corpus_texts.extend(texts)
+        self._corpus_metas.extend(metadatas)
+
+        if self._corpus_vecs is None:
+            self._corpus_vecs = vecs
+        else:
+            self._corpus_vecs = np.vstack([self._corpus_vecs, vecs])
+
+    def _matmul_search(self, query_vec, k: int) -> List[Dict[str, Any]]:
+        """Top-k cosine search as one BLAS matmul over the RAM mirror"""
+        q = np.asarray(query_vec, dtype=np.float32)
+        norm = np.linalg.norm(q)
+        if norm > 0:
+            q = q / norm
+
+        scores = self._corpus_vecs @ q
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        formatted = []
+        for i in top:
+            similarity = float(scores[i])
+            formatted.append({
+                'text': self._corpus_texts[i],
+                'metadata': self._corpus_metas[i],
+                'distance': 1 - similarity,
+                'similarity': similarity
+            })
+        return formatted
+
+    def _embed_texts(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts, serving repeated content from the persistent cache
+
+        Re-ingested videos and boilerplate shared between videos skip
+        the encoder forward pass; only never-seen chunks are encoded.
+        """
+        if self._emb_cache is None:
+            return self.llm_wrapper.get_embeddings(texts)
+
+        return self._emb_cache.get_or_compute(
+            texts, self._emb_cache_tag, self.llm_wrapper.get_embeddings
+        )
+
+    def _insert(self, embeddings, texts, metadatas, ids):
+        """
+        Write documents into Chroma and mirror them in RAM
+
+        collection.add is issued in CHROMA_BATCH_SIZE slices: insert
+        throughput peaks when SQLite transaction overhead and HNSW
+        locking amortize over a few hundred rows, and degrades again on
+        very large single calls.
+
+        Vectors go to Chroma as float16 — half the serialization,
+        disk and page-cache bytes of float32 for a negligible cosine
+        recall difference on MiniLM embeddings. The RAM mirror keeps
+        float32 so matmul search stays on the fast BLAS path.
+        """
+        step = self._chroma_batch
+        embeddings = np.asarray(embeddings)
+
+        # Re-adding a video must not duplicate rows: collection.add
+        # skips ids it already holds, so the mirror, count cache and
+        # video index drop them too and stay consistent with Chroma
+        if self._known_ids is not None:
+            fresh = [i for i, chunk_id in enumerate(ids)
+                     if chunk_id not in self._known_ids]
+            if not fresh:
+                logger.debug("↩️ All %d ids already stored, skipping", len(ids))
+                return
+            if len(fresh) != len(ids):
+                embeddings = embeddings[fresh]
+                texts = [texts[i] for i in fresh]
+                metadatas = [metadatas[i] for i in fresh]
+                ids = [ids[i] for i in fresh]
+
+        stored = (
+            embeddings.astype(np.float16)
+            if embeddings.dtype in (np.float32, np.float64) else embeddings
+        )
+        try:
+            for start in range(0, len(ids), step):
+                self.collection.add(
+                    embeddings=stored[start:start + step],
+                    documents=texts[start:start + step],
+                    metadatas=metadatas[start:start + step],
+                    ids=ids[start:start + step]
+                )
+        except Exception as e:
+            logger.error("❌ Error adding documents: %s", e)
+            raise
+
+        self._append_corpus(embeddings, texts, metadatas)
+        self._count_cache += len(ids)
+        if self._known_ids is not None:
+            self._known_ids.update(ids)
+
+        if self._video_index is not None:
+            for chunk_id, metadata in zip(ids, metadatas):
+                self._video_index[metadata["video_id"]].append(chunk_id)
+
+    def _embed_and_insert(self, texts, metadatas, ids):
+        """
+        Embed and insert in overlapping micro-batches
+
+        While the encoder works on slice i+1, a single writer thread
+        inserts slice i into Chroma, so encoding pipelines with the
+        SQLite write path instead of serializing behind it. At most one
+        batch is in flight, keeping peak memory at O(slice) rather than
+        O(all chunks); the lone writer preserves insert order. On a GPU
+        the encoder's forward pass (LLMWrapper moves the model to CUDA
+        when available) overlaps the CPU-side SQLite/HNSW work.
+        """
+        if len(texts) <= self.EMBED_SLICE:
+            self._insert(self._embed_texts(texts), texts, metadatas, ids)
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            pending = None
+            for start in range(0, len(texts), self.EMBED_SLICE):
+                window = slice(start, start + self.EMBED_SLICE)
+                embeddings = self._embed_texts(texts[window])
+
+                if pending is not None:
+                    pending.result()  # backpressure: one batch in flight
+                pending = writer.submit(
+                    self._insert, embeddings,
+                    texts[window], metadatas[window], ids[window]
+                )
+
+            if pending is not None:
+                pending.result()
+
+    def add_documents(self, documents: List[Dict[str, Any]], video_id: str,
+                      embeddings=None) -> int:
+        """
+        Add documents (chunks) to Chroma collection
+
+        Args:
+            documents: Chunk dicts from TextProcessor.split_text
+            video_id: YouTube video ID the chunks belong to
+            embeddings: Optional precomputed vectors (e.g. from the
+                on-disk embedding cache); computed here when omitted
+        """
         if not documents:
             raise ValueError("No documents to add")
 
+        # Comprehensions instead of append loops: the interpreter builds
+        # these lists with a specialized opcode and the shared source URL
+        # is formatted once, not once per chunk
         texts = [doc["text"] for doc in documents]
-        print(f"🧠 Generating embeddings for {len(texts)} chunks...")
-        embeddings = self.llm_wrapper.get_embeddings(texts)
-
-        ids, metadatas = [], []
-        for i, doc in enumerate(documents):
-            ids.append(f"{video_id}_chunk_{i}")
-            metadatas.append({
+        ids = [f"{video_id}_chunk_{i}" for i in range(len(documents))]
+        source_url = f"https://www.youtube.com/watch?v={video_id}"
+        metadatas = [
+            {
                 "video_id": video_id,
                 "title": doc.get("title"),
                 "chunk_id": i,
-                "chunk_size": len(doc["text"]),
-                "source": f"https://www.youtube.com/watch?v={video_id}"
-            })
+                "chunk_size": len(text),
+                "source": source_url
+            }
+            for i, (doc, text) in enumerate(zip(documents, texts))
+        ]
 
-        try:
-            self.collection.add(
-                embeddings=embeddings,
-                documents=texts,
-                metadatas=metadatas,
-                ids=ids
-            )
-        except Exception as e:
-            print(f"❌ Error adding documents: {e}")
-            raise
+        if embeddings is None:
+            logger.debug("🧠 Generating embeddings for %d chunks...", len(texts))
+            self._embed_and_insert(texts, metadatas, ids)
+        else:
+            self._insert(embeddings, texts, metadatas, ids)
+
+        logger.debug("✅ Added %d docs", len(documents))
+        return len(documents)
+
+    def add_documents_soa(self, texts: List[str], video_id: str,
+                          chunk_ids: List[int] = None, title: str = None,
+                          embeddings=None) -> int:
+        """
+        Add one video's chunks from parallel arrays (no chunk dicts)
+
+        Structure-of-arrays twin of add_documents: callers that already
+        hold plain chunk texts skip building (and this method skips
+        re-reading) a dict per chunk — the metadata rows are derived
+        straight from the text list.
+
+        Args:
+            texts: Chunk texts, in order
+            video_id: YouTube video ID the chunks belong to
+            chunk_ids: Optional per-chunk ids; defaults to 0..N-1
+            title: Video title stored on every chunk's metadata
+            embeddings: Optional precomputed vectors; computed here when
+                omitted
+        """
+        if not texts:
+            raise ValueError("No documents to add")
+
+        if chunk_ids is None:
+            chunk_ids = range(len(texts))
+
+        ids = [f"{video_id}_chunk_{i}" for i in chunk_ids]
+        source_url = f"https://www.youtube.com/watch?v={video_id}"
+        metadatas = [
+            {
+                "video_id": video_id,
+                "title": title,
+                "chunk_id": i,
+                "chunk_size": len(text),
+                "source": source_url
+            }
+            for i, text in zip(chunk_ids, texts)
+        ]
 
-        print(f"✅ Added {len(documents)} docs. Total: {self.collection.count()}")
+        if embeddings is None:
+            logger.debug("🧠 Generating embeddings for %d chunks...", len(texts))
+            self._embed_and_insert(texts, metadatas, ids)
+        else:
+            self._insert(embeddings, texts, metadatas, ids)
+
+        logger.debug("✅ Added %d docs", len(texts))
+        return len(texts)
+
+    def add_documents_batch(self, documents: List[Dict[str, Any]],
+                            embeddings=None) -> int:
+        """
+        Add chunks from several videos with a single embedding call
+
+        Each document must carry its own 'video_id' and 'chunk_id'
+        metadata (as produced by TextProcessor.split_text).
+
+        Args:
+            documents: Chunk dicts spanning one or more videos
+            embeddings: Optional precomputed vectors; computed here when
+                omitted
+        """
+        if not documents:
+            raise ValueError("No documents to add")
+
+        texts = [doc["text"] for doc in documents]
+        ids = [f"{doc['video_id']}_chunk_{doc['chunk_id']}" for doc in documents]
+        metadatas = [
+            {
+                "video_id": doc["video_id"],
+                "title": doc.get("title"),
+                "chunk_id": doc["chunk_id"],
+                "chunk_size": len(text),
+                "source": f"https://www.youtube.com/watch?v={doc['video_id']}"
+            }
+            for doc, text in zip(documents, texts)
+        ]
+
+        if embeddings is None:
+            logger.debug("🧠 Generating embeddings for %d chunks (batched)...",
+                         len(texts))
+            self._embed_and_insert(texts, metadatas, ids)
+        else:
+            self._insert(embeddings, texts, metadatas, ids)
+
+        logger.debug("✅ Added %d docs", len(documents))
         return len(documents)
 
+    def _microbatch_worker(self):
+        """
+        Coalesce concurrent query encodes into single model calls
+
+        Blocks until a (text, future) pair arrives, then keeps draining
+        the queue for MICROBATCH_WINDOW (or until MICROBATCH_MAX texts
+        are collected) and encodes everything in one call. A batch-of-8
+        encode costs little more than a batch-of-1, so under concurrent
+        UI load per-query encoder cost drops nearly linearly; a lone
+        query pays at most the window in extra latency.
+        """
+        while True:
+            items = [self._microbatch_queue.get()]
+            deadline = time.monotonic() + self.MICROBATCH_WINDOW
+            while len(items) < self.MICROBATCH_MAX:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    items.append(self._microbatch_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                vecs = self.llm_wrapper.get_embeddings([text for text, _ in items])
+            except Exception as e:
+                for _, future in items:
+                    future.set_exception(e)
+                continue
+
+            for i, (_, future) in enumerate(items):
+                future.set_result(vecs[i:i + 1])
+
+    def _embed_query(self, query: str):
+        """Encode one query, through the micro-batcher when enabled"""
+        if self._microbatch_queue is None:
+            return self.llm_wrapper.get_embeddings(query)
+
+        future = Future()
+        self._microbatch_queue.put((query, future))
+        return future.result()
+
+    def _embed_query_cached(self, query: str):
+        """
+        Embed a query, reusing the vector for recently seen queries
+
+        Keyed on the stripped, lowercased text so retries and trivial
+        re-asks skip the encoder entirely. LRU-bounded via OrderedDict,
+        same as the response caches in the UI layer.
+        """
+        key = query.strip().lower()
+        cached = self._query_embed_cache.get(key)
+        if cached is not None:
+            self._query_embed_cache.move_to_end(key)
+            return cached
+
+        embedding = self._embed_query(query)
+        self._query_embed_cache[key] = embedding
+        if len(self._query_embed_cache) > self.QUERY_EMBED_CACHE_SIZE:
+            self._query_embed_cache.popitem(last=False)
+        return embedding
+
+    def is_empty(self) -> bool:
+        """Whether the collection holds no documents (tracked locally)"""
+        return self._count_cache == 0
+
     def similarity_search(self, query: str, k: int = None) -> List[Dict[str, Any]]:
         """Search for relevant chunks"""
-        k = k or Config.TOP_K_RESULTS
-        query_embedding = self.llm_wrapper.get_embeddings(query)
+        k = k or self._top_k
+        query_embedding = self._embed_query_cached(query)
+
+        # Serve from the RAM mirror with one matmul when available
+        if self._matmul_enabled and self._corpus_vecs is not None and len(self._corpus_vecs):
+            return self._matmul_search(query_embedding[0], k)
+
+        # Match the float16 storage precision (see _insert) so the
+        # query vector moves half the bytes too
+        query_vecs = np.asarray(query_embedding)
+        if query_vecs.dtype in (np.float32, np.float64):
+            query_vecs = query_vecs.astype(np.float16)
+
         results = self.collection.query(
-            query_embeddings=query_embedding,
+            query_embeddings=query_vecs,
             n_results=k,
             include=['documents', 'metadatas', 'distances']
         )
 
-        formatted = []
-        if results['documents'] and results['documents'][0]:
-            for i in range(len(results['documents'][0])):
-                formatted.append({
-                    'text': results['documents'][0][i],
-                    'metadata': results['metadatas'][0][i],
-                    'distance': results['distances'][0][i],
-                    'similarity': 1 - results['distances'][0][i]
-                })
-        return formatted
+        if not results['documents'] or not results['documents'][0]:
+            return []
+
+        # One vectorized subtraction and a zipped comprehension instead
+        # of per-row indexing back into the nested result lists
+        docs = results['documents'][0]
+        metas = results['metadatas'][0]
+        dists = np.asarray(results['distances'][0], dtype=np.float32)
+        sims = 1.0 - dists
+
+        return [
+            {
+                'text': doc,
+                'metadata': meta,
+                'distance': float(dist),
+                'similarity': float(sim)
+            }
+            for doc, meta, dist, sim in zip(docs, metas, dists, sims)
+        ]
+
+    def _distinct_video_ids(self):
+        """
+        Distinct video ids straight from Chroma's SQLite, or None
+
+        One indexed DISTINCT query server-side instead of paging every
+        chunk's metadata dict through Python. Depends on Chroma's
+        embedding_metadata schema, so any surprise there returns None
+        and the caller falls back to the metadata scan.
+        """
+        db_file = os.path.join(self._db_path, "chroma.sqlite3")
+        try:
+            conn = sqlite3.connect(db_file)
+            rows = conn.execute(
+                "SELECT DISTINCT string_value FROM embedding_metadata "
+                "WHERE key = 'video_id'"
+            ).fetchall()
+            conn.close()
+            return sorted(row[0] for row in rows if row[0])
+        except Exception as e:
+            logger.debug("Distinct video-id query unavailable: %s", e)
+            return None
 
     def get_collection_stats(self) -> Dict[str, Any]:
         """Return Chroma collection statistics for UI"""
@@ -126,8 +624,8 @@ class VectorStore:
             count = self.collection.count()
             stats = {
                 "total_documents": count,
-                "collection_name": Config.COLLECTION_NAME,
-                "db_path": str(Config.CHROMA_DB_PATH),
+                "collection_name": self._collection_name,
+                "db_path": str(self._db_path),
             }
 
             if count == 0:
@@ -135,57 +633,103 @@ class VectorStore:
                 stats["video_ids"] = []
                 return stats
 
-            page_size = 200
-            video_ids = set()
+            # Warm index: answer from the dict. Cold: prefer one
+            # DISTINCT SQL query; only if the schema probe fails does
+            # the metadata-paging scan run (which also builds the
+            # chunk-id index that deletes use).
+            if self._video_index is None:
+                video_ids = self._distinct_video_ids()
+                if video_ids is not None:
+                    stats["unique_videos"] = len(video_ids)
+                    stats["video_ids"] = video_ids
+                    return stats
 
-            for offset in range(0, count, page_size):
-                batch = self.collection.get(
-                    limit=page_size,
-                    offset=offset,
-                    include=["metadatas"]
-                )
+                page_size = 200
+                video_index = defaultdict(list)
+
+                for offset in range(0, count, page_size):
+                    batch = self.collection.get(
+                        limit=page_size,
+                        offset=offset,
+                        include=["metadatas"]
+                    )
+
+                    chunk_ids = batch.get("ids") or []
+                    metadatas = batch.get("metadatas") or []
+                    for chunk_id, metadata in zip(chunk_ids, metadatas):
+                        if not metadata:
+                            continue
+                        video_id = metadata.get("video_id")
+                        if video_id:
+                            video_index[video_id].append(chunk_id)
 
-                metadatas = batch.get("metadatas") or []
-                for metadata in metadatas:
-                    if not metadata:
-                        continue
-                    video_id = metadata.get("video_id")
-                    if video_id:
-                        video_ids.add(video_id)
+                    if not chunk_ids:
+                        break  # safety against unexpected empty pages
 
-                if not batch.get("ids"):
-                    break  # safety against unexpected empty pages
+                self._video_index = video_index
 
-            stats["unique_videos"] = len(video_ids)
-            stats["video_ids"] = sorted(video_ids)
+            stats["unique_videos"] = len(self._video_index)
+            stats["video_ids"] = sorted(self._video_index)
             return stats
 
         except Exception as e:
-            print(f"⚠️ Could not fetch collection stats: {e}")
+            logger.warning("⚠️ Could not fetch collection stats: %s", e)
             return {
                 "total_documents": 0,
-                "collection_name": Config.COLLECTION_NAME,
-                "db_path": str(Config.CHROMA_DB_PATH),
+                "collection_name": self._collection_name,
+                "db_path": str(self._db_path),
                 "unique_videos": 0,
                 "video_ids": []
             }
 
     def delete_video(self, video_id: str) -> int:
         """Delete all chunks belonging to a given YouTube video"""
-        results = self.collection.get(where={"video_id": video_id})
-        if results['ids']:
-            self.collection.delete(ids=results['ids'])
-            count = len(results['ids'])
-            print(f"🗑 Deleted {count} docs for video: {video_id}")
-            return count
-        print(f"No docs found for {video_id}")
-        return 0
+        if self._video_index is not None:
+            # The index already knows how many chunks the video has, so
+            # a missing video costs no Chroma call at all
+            count = len(self._video_index.pop(video_id, []))
+            if count == 0:
+                logger.info("No docs found for %s", video_id)
+                return 0
+            self.collection.delete(where={"video_id": video_id})
+        else:
+            # Cold index: one filtered delete, counted by the before /
+            # after difference — no id list shipped through Python
+            before = self.collection.count()
+            self.collection.delete(where={"video_id": video_id})
+            count = before - self.collection.count()
+            if count == 0:
+                logger.info("No docs found for %s", video_id)
+                return 0
+
+        self._load_corpus()  # rebuild the RAM mirror without this video
+        logger.info("🗑 Deleted %d docs for video: %s", count, video_id)
+        return count
 
     def reset_collection(self):
         """Completely reset collection"""
-        self.client.delete_collection(name=Config.COLLECTION_NAME)
+        self.client.delete_collection(name=self._collection_name)
         self.collection = self.client.create_collection(
-            name=Config.COLLECTION_NAME,
-            metadata={"hnsw:space": "cosine", "dimension": 384}
+            name=self._collection_name,
+            metadata=self._collection_metadata()
         )
-        print("🔄 Collection reset successfully")
+        self._load_corpus()
+        logger.info("🔄 Collection reset successfully")
+
+
+# Process-wide instance: constructing a VectorStore runs cleanup, the
+# writability check, Chroma client setup and the RAM-mirror load, so
+# every component sharing one instance also shares one client, one
+# mirror and one set of caches
+_instance = None
+_instance_lock = threading.Lock()
+
+
+def get_vector_store() -> VectorStore:
+    """Return the shared VectorStore, creating it on first call"""
+    global _instance
+    if _instance is None:
+        with _instance_lock:
+            if _instance is None:
+                _instance = VectorStore()
+    return _instance
@@ -1,47 +1,73 @@
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional, Dict
 from youtube_transcript_api import YouTubeTranscriptApi
 from config import Config
 import requests
+from requests.adapters import HTTPAdapter
+
+# Shared keep-alive session for the oembed title lookups: the TLS
+# handshake to youtube.com is paid once per pooled connection instead
+# of once per call, and concurrent batch-ingest workers draw from the
+# same pool
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
+
+@lru_cache(maxsize=4096)
+def _fetch_video_title(video_id: str) -> str:
+    """
+    Fetch a video's title from the oembed endpoint (memoized)
+
+    A module-level helper (not a method — self would break hashing) so
+    re-ingests of the same video during development skip the HTTP round
+    trip entirely. Raises on failure, which lru_cache does not memoize,
+    so transient errors are retried on the next call.
+    """
+    resp = _SESSION.get(
+        "https://www.youtube.com/oembed",
+        params={"url": f"https://www.youtube.com/watch?v={video_id}", "format": "json"},
+        timeout=10,
+    )
+    resp.raise_for_status()
+    return resp.json().get("title", video_id)
+
 
 class YouTubeLoader:
     """Load and process YouTube video transcripts using youtube-transcript-api"""
-    
+
+    # One precompiled alternation covering watch, short and embed URLs,
+    # so extraction is a single scan instead of up to three searches
+    # (each of which recompiled its pattern per call)
+    _VIDEO_ID_RE = re.compile(
+        r'(?:https?:\/\/)?(?:www\.)?'
+        r'(?:youtube\.com\/(?:watch\?v=|embed\/)|youtu\.be\/)'
+        r'([a-zA-Z0-9_-]{11})'
+    )
+
     def __init__(self):
         """Initialize the loader and set transcripts directory"""
         self.transcripts_dir = Config.TRANSCRIPTS_DIR
         print("✓ YouTubeLoader initialized (using youtube-transcript-api)")
-    
+
     @staticmethod
     def extract_video_id(url: str) -> Optional[str]:
         """Extract video ID from YouTube URL"""
-        patterns = [
-            r'(?:https?:\/\/)?(?:www\.)?youtube\.com\/watch\?v=([a-zA-Z0-9_-]{11})',
-            r'(?:https?:\/\/)?(?:www\.)?youtu\.be\/([a-zA-Z0-9_-]{11})',
-            r'(?:https?:\/\/)?(?:www\.)?youtube\.com\/embed\/([a-zA-Z0-9_-]{11})'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        
+        match = YouTubeLoader._VIDEO_ID_RE.search(url)
+        if match:
+            return match.group(1)
+
         # Assume it's a video ID if it's an 11-char string
         if len(url) == 11:
             return url
-        
+
         return None
 
     def fetch_video_title(self, video_id: str) -> str:
             try:
-                resp = requests.get(
-                    "https://www.youtube.com/oembed",
-                    params={"url": f"https://www.youtube.com/watch?v={video_id}", "format": "json"},
-                    timeout=10,
-                )
-                resp.raise_for_status()
-                return resp.json().get("title", video_id)
+                return _fetch_video_title(video_id)
             except Exception as exc:
                 print(f"⚠️ Could not fetch title for {video_id}: {exc}")
                 return video_id
@@ -65,29 +91,38 @@ class YouTubeLoader:
             raise ValueError(f"Could not extract video ID from URL: {video_url}")
         
         try:
-            api = YouTubeTranscriptApi()
-            transcript_list = api.list(video_id)
-            
-            # Find a transcript in the preferred languages
-            transcript = None
-            try:
-                transcript = transcript_list.find_transcript(languages)
-            except Exception:
-                # If exact match not found, try finding a generated one
+            # The oembed title lookup and the transcript fetch are
+            # independent HTTP round-trips, so the title runs on a side
+            # thread while the transcript is listed and fetched — one
+            # RTT hidden behind the other
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                title_future = pool.submit(self.fetch_video_title, video_id)
+
+                api = YouTubeTranscriptApi()
+                transcript_list = api.list(video_id)
+
+                # Find a transcript in the preferred languages
+                transcript = None
                 try:
-                    transcript = transcript_list.find_generated_transcript(languages)
-                except Exception as e:
-                    available_langs = [t.language_code for t in transcript_list]
-                    raise Exception(f"No transcript found in {languages}. Available: {available_langs}") from e
-
-            # Fetch the full transcript data
-            transcript_data = transcript.fetch()
-            title = self.fetch_video_title(video_id)
+                    transcript = transcript_list.find_transcript(languages)
+                except Exception:
+                    # If exact match not found, try finding a generated one
+                    try:
+                        transcript = transcript_list.find_generated_transcript(languages)
+                    except Exception as e:
+                        available_langs = [t.language_code for t in transcript_list]
+                        raise Exception(f"No transcript found in {languages}. Available: {available_langs}") from e
+
+                # Fetch the full transcript data
+                transcript_data = transcript.fetch()
+                title = title_future.result()
             
-            # --- THIS IS THE FIX ---
-            # Changed segment['text'] to segment.text
-            full_transcript = " ".join([segment.text for segment in transcript_data])
-            # --- END OF FIX ---
+            # Skip empty and whitespace-only segments while joining, so
+            # they never become stray double spaces that the chunker
+            # later treats as break candidates
+            full_transcript = " ".join(
+                s.text for s in transcript_data if s.text and s.text.strip()
+            )
             
             result = {
                 'video_id': video_id,
@@ -118,13 +153,18 @@ class YouTubeLoader:
         file_path = os.path.join(self.transcripts_dir, f"{video_data['video_id']}.txt")
         
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                # Use video_id as title since we don't fetch the real title
-                f.write(f"Title: {video_data.get('title', video_data['video_id'])}\n") 
-                f.write(f"URL: {video_data.get('url', 'N/A')}\n")
-                f.write(f"Language: {video_data.get('language', 'N/A')}\n")
-                f.write(f"{'='*30}\n\n")
-                f.write(video_data['transcript'])
+            # One writelines through a large buffer: the multi-MB
+            # transcript goes down in a handful of write syscalls
+            # instead of one per 8KB default-buffer flush
+            with open(file_path, 'w', encoding='utf-8',
+                      buffering=1024 * 1024) as f:
+                f.writelines([
+                    f"Title: {video_data.get('title', video_data['video_id'])}\n",
+                    f"URL: {video_data.get('url', 'N/A')}\n",
+                    f"Language: {video_data.get('language', 'N/A')}\n",
+                    f"{'='*30}\n\n",
+                    video_data['transcript'],
+                ])
             
             print(f"✓ Transcript saved to: {file_path}")
             